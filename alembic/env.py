@@ -10,6 +10,7 @@ from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
+from arch_hexagonal_postgresql_fast.adapters.database.engine import asyncpg_url
 from arch_hexagonal_postgresql_fast.adapters.database.sqlalchemy_models import Base
 from arch_hexagonal_postgresql_fast.config import Settings
 
@@ -24,7 +25,10 @@ if config.config_file_name is not None:
 
 # Get database URL from settings
 settings = Settings()
-config.set_main_option("sqlalchemy.url", settings.database_url)
+config.set_main_option(
+    "sqlalchemy.url",
+    asyncpg_url(settings.database_url).render_as_string(hide_password=False).replace("%", "%%"),
+)
 
 # add your model's MetaData object here
 # for 'autogenerate' support
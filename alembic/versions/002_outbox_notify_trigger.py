@@ -0,0 +1,48 @@
+"""notify outbox listeners on insert
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-01-02 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: str | None = "001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Fire NOTIFY outbox_new whenever an outbox event is inserted."""
+    # Empty payload: PostgreSQL folds identical notifications within a
+    # transaction, so a burst of inserts wakes the worker only once.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION outbox_notify() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('outbox_new', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER outbox_events_notify
+        AFTER INSERT ON outbox_events
+        FOR EACH ROW EXECUTE FUNCTION outbox_notify()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the outbox notification trigger."""
+    op.execute("DROP TRIGGER IF EXISTS outbox_events_notify ON outbox_events")
+    op.execute("DROP FUNCTION IF EXISTS outbox_notify()")
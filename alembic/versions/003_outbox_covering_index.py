@@ -0,0 +1,61 @@
+"""narrow outbox indexes to one covering partial index
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-01-03 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace outbox indexes with a single covering partial index."""
+    op.drop_index("idx_outbox_failed", table_name="outbox_events")
+    op.drop_index("idx_outbox_unpublished", table_name="outbox_events")
+
+    # published_at is always NULL inside the partial index, so it is not a key.
+    # attempts is carried along so the poller can filter on it from the index;
+    # the failed-events check gets its own index in 007. Because published_at
+    # is in the predicate and attempts is an INCLUDE column, updates to either
+    # are never HOT, so no fillfactor is reserved for them. payload is
+    # deliberately not included: large payloads would exceed the B-tree tuple
+    # size limit and make inserts fail.
+    op.create_index(
+        "idx_outbox_unpublished",
+        "outbox_events",
+        ["created_at"],
+        postgresql_include=["id", "attempts"],
+        postgresql_where=sa.text("published_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Restore the original outbox indexes."""
+    # Earlier versions of this revision set fillfactor = 80; clear it if present
+    op.execute("ALTER TABLE outbox_events RESET (fillfactor)")
+    op.drop_index("idx_outbox_unpublished", table_name="outbox_events")
+    op.create_index(
+        "idx_outbox_unpublished",
+        "outbox_events",
+        ["published_at", "created_at"],
+        postgresql_where=sa.text("published_at IS NULL"),
+    )
+    op.create_index(
+        "idx_outbox_failed",
+        "outbox_events",
+        ["attempts", "created_at"],
+        postgresql_where=sa.text("attempts > 0 AND published_at IS NULL"),
+    )
@@ -0,0 +1,110 @@
+"""create payments, transactions and customers tables
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-01-04 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Table comment marking the tables this revision created, so downgrade drops
+# only those and leaves tables that create_all made before it ran. The models
+# do not carry it; autogenerate will offer to drop it, which should be removed
+# from the generated revision.
+_CREATED_BY = "created by alembic revision 004"
+
+
+def upgrade() -> None:
+    """Create the payment tables previously created by the app at startup."""
+    # Databases that ran the app before this revision already have these
+    # tables from Base.metadata.create_all; leave them as they are.
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "payments" not in existing:
+        op.create_table(
+            "payments",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("customer_id", sa.String(length=255), nullable=False),
+            sa.Column("amount_value", sa.Numeric(precision=10, scale=2), nullable=False),
+            sa.Column("amount_currency", sa.String(length=3), nullable=False),
+            sa.Column("payment_method", sa.String(length=50), nullable=False),
+            sa.Column("provider", sa.String(length=50), nullable=False),
+            sa.Column("status", sa.String(length=50), nullable=False),
+            sa.Column("provider_transaction_id", sa.String(length=255), nullable=True),
+            sa.Column("refunded_amount_value", sa.Numeric(precision=10, scale=2), nullable=False),
+            sa.Column("refunded_amount_currency", sa.String(length=3), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("payment_metadata", sa.JSON(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            comment=_CREATED_BY,
+        )
+        op.create_index("ix_payments_customer_id", "payments", ["customer_id"])
+        op.create_index("ix_payments_status", "payments", ["status"])
+        op.create_index(
+            "ix_payments_provider_transaction_id", "payments", ["provider_transaction_id"]
+        )
+        op.create_index("ix_payments_created_at", "payments", ["created_at"])
+
+    if "transactions" not in existing:
+        op.create_table(
+            "transactions",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("payment_id", sa.String(length=36), nullable=False),
+            sa.Column("amount_value", sa.Numeric(precision=10, scale=2), nullable=False),
+            sa.Column("amount_currency", sa.String(length=3), nullable=False),
+            sa.Column("transaction_type", sa.String(length=20), nullable=False),
+            sa.Column("status", sa.String(length=50), nullable=False),
+            sa.Column("provider", sa.String(length=50), nullable=False),
+            sa.Column("provider_transaction_id", sa.String(length=255), nullable=True),
+            sa.Column("error_message", sa.String(length=1000), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("transaction_metadata", sa.JSON(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            comment=_CREATED_BY,
+        )
+        op.create_index("ix_transactions_payment_id", "transactions", ["payment_id"])
+        op.create_index(
+            "ix_transactions_provider_transaction_id",
+            "transactions",
+            ["provider_transaction_id"],
+        )
+        op.create_index("ix_transactions_created_at", "transactions", ["created_at"])
+
+    if "customers" not in existing:
+        op.create_table(
+            "customers",
+            sa.Column("id", sa.String(length=36), nullable=False),
+            sa.Column("email", sa.String(length=255), nullable=False),
+            sa.Column("name", sa.String(length=255), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("customer_metadata", sa.JSON(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            comment=_CREATED_BY,
+        )
+        op.create_index("ix_customers_email", "customers", ["email"], unique=True)
+
+
+def downgrade() -> None:
+    """Drop the payment tables this revision created.
+
+    Tables that already existed when it ran are left in place, data and all.
+    """
+    inspector = sa.inspect(op.get_bind())
+    existing = set(inspector.get_table_names())
+    for table in ("customers", "transactions", "payments"):
+        if table in existing and inspector.get_table_comment(table)["text"] == _CREATED_BY:
+            op.drop_table(table)
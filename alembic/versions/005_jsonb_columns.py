@@ -0,0 +1,43 @@
+"""store payloads and metadata as jsonb
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-01-05 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COLUMNS = (
+    ("outbox_events", "payload"),
+    ("payments", "payment_metadata"),
+    ("transactions", "transaction_metadata"),
+    ("customers", "customer_metadata"),
+)
+
+
+def upgrade() -> None:
+    """Convert JSON text columns to jsonb.
+
+    asyncpg exchanges jsonb in binary format and the server keeps it
+    pre-parsed, so reads skip re-parsing the stored text. Each ALTER rewrites
+    its table under an ACCESS EXCLUSIVE lock.
+    """
+    for table, column in _COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+
+
+def downgrade() -> None:
+    """Convert jsonb columns back to JSON text."""
+    for table, column in _COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
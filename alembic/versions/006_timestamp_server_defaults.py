@@ -0,0 +1,42 @@
+"""default timestamps to the database clock
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-01-06 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COLUMNS = (
+    ("payments", "created_at"),
+    ("payments", "updated_at"),
+    ("transactions", "created_at"),
+    ("customers", "created_at"),
+)
+
+
+def upgrade() -> None:
+    """Add database-clock defaults; outbox inserts rely on it for created_at."""
+    # Per-row clock so events written by one transaction keep their order
+    op.alter_column("outbox_events", "created_at", server_default=sa.func.clock_timestamp())
+    for table, column in _COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Drop the timestamp defaults."""
+    for table, column in (("outbox_events", "created_at"), *_COLUMNS):
+        op.alter_column(table, column, server_default=None)
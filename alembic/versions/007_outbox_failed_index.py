@@ -0,0 +1,39 @@
+"""index the failed-events predicate
+
+Revision ID: 007
+Revises: 006
+Create Date: 2024-01-07 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add a partial index on attempts for the failed-events query."""
+    # attempts is already carried by idx_outbox_unpublished, so updates to it
+    # were not HOT-eligible before; this index adds no new write penalty but
+    # lets ``attempts >= N`` be a range scan instead of a walk of the backlog.
+    op.create_index(
+        "idx_outbox_failed",
+        "outbox_events",
+        ["attempts"],
+        postgresql_where=sa.text("published_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the failed-events index."""
+    op.drop_index("idx_outbox_failed", table_name="outbox_events")
@@ -2,20 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from arch_hexagonal_postgresql_fast.adapters.api.fastapi_app import app_state
-from arch_hexagonal_postgresql_fast.adapters.database.postgresql_outbox_repository import (
-    PostgreSQLOutboxRepository,
-)
-from arch_hexagonal_postgresql_fast.adapters.database.postgresql_payment_repository import (
-    PostgreSQLPaymentRepository,
+from arch_hexagonal_postgresql_fast.adapters.api.state import app_state
+from arch_hexagonal_postgresql_fast.adapters.database.unit_of_work import (
+    SQLAlchemyUnitOfWork,
 )
-from arch_hexagonal_postgresql_fast.adapters.database.postgresql_transaction_repository import (
-    PostgreSQLTransactionRepository,
+from arch_hexagonal_postgresql_fast.application.ports.command_publisher import (
+    CommandPublisher,
 )
 from arch_hexagonal_postgresql_fast.application.ports.event_publisher import (
     EventPublisher,
@@ -23,66 +19,71 @@ from arch_hexagonal_postgresql_fast.application.ports.event_publisher import (
 from arch_hexagonal_postgresql_fast.application.ports.idempotency_store import (
     IdempotencyStore,
 )
-from arch_hexagonal_postgresql_fast.application.ports.outbox_repository import (
-    OutboxRepository,
-)
 from arch_hexagonal_postgresql_fast.application.ports.payment_provider import (
     PaymentProvider,
 )
-from arch_hexagonal_postgresql_fast.application.ports.payment_repository import (
-    PaymentRepository,
+from arch_hexagonal_postgresql_fast.application.ports.unit_of_work import UnitOfWork
+from arch_hexagonal_postgresql_fast.application.services.request_coalescer import (
+    RequestCoalescer,
 )
-from arch_hexagonal_postgresql_fast.application.ports.transaction_repository import (
-    TransactionRepository,
+from arch_hexagonal_postgresql_fast.application.use_cases.process_payment import (
+    ProcessPaymentResponse,
 )
 
 
-async def get_db_session() -> AsyncGenerator[AsyncSession]:
-    """Get database session."""
+@asynccontextmanager
+async def open_uow() -> AsyncIterator[UnitOfWork]:
+    """Open a unit of work on a fresh session, closed when the block exits.
+
+    For work whose lifetime is not the request's, such as an operation
+    shared through a RequestCoalescer.
+    """
     async with app_state.session_maker() as session:
-        yield session
+        yield SQLAlchemyUnitOfWork(session)
+
 
+async def get_uow() -> AsyncGenerator[UnitOfWork]:
+    """Get request-scoped unit of work (one session for all repositories)."""
+    async with open_uow() as uow:
+        yield uow
 
-async def get_payment_repository(
-    session: AsyncSession = Depends(get_db_session),
-) -> PaymentRepository:
-    """Get payment repository."""
-    return PostgreSQLPaymentRepository(session)
 
+@dataclass(frozen=True, slots=True)
+class PaymentServices:
+    """Process-wide collaborators shared by the payment write routes."""
 
-async def get_transaction_repository(
-    session: AsyncSession = Depends(get_db_session),
-) -> TransactionRepository:
-    """Get transaction repository."""
-    return PostgreSQLTransactionRepository(session)
+    provider: PaymentProvider
+    events: EventPublisher
+    idempotency: IdempotencyStore
 
 
-async def get_outbox_repository(
-    session: AsyncSession = Depends(get_db_session),
-) -> OutboxRepository:
-    """Get outbox repository."""
-    return PostgreSQLOutboxRepository(session)
+async def get_payment_services(provider: str = "stripe") -> PaymentServices:
+    """Get payment provider, event publisher and idempotency store in one step.
 
+    The three are singletons on ``app_state``, so resolving them as one
+    dependency keeps FastAPI's per-request dependency graph small instead of
+    solving a separate node for each.
 
-async def get_payment_provider(provider: str = "stripe") -> PaymentProvider:
-    """Get payment provider based on name."""
-    if provider == "stripe" and app_state.stripe_adapter:
-        return app_state.stripe_adapter
-    if provider == "paypal" and app_state.paypal_adapter:
-        return app_state.paypal_adapter
-    # Fallback to default
-    if app_state.stripe_adapter:
-        return app_state.stripe_adapter
-    if app_state.paypal_adapter:
-        return app_state.paypal_adapter
-    raise ValueError("No payment provider configured")
+    Kept as ``async def``: FastAPI runs plain ``def`` dependencies in the
+    threadpool, which costs more than awaiting a coroutine that never suspends.
+    """
+    selected = app_state.payment_providers.get(provider, app_state.default_payment_provider)
+    if selected is None:
+        raise ValueError("No payment provider configured")
+    return PaymentServices(
+        provider=selected,
+        events=app_state.event_publisher,
+        idempotency=app_state.idempotency_store,
+    )
 
 
-async def get_event_publisher() -> EventPublisher:
-    """Get event publisher."""
-    return app_state.event_publisher
+async def get_payment_coalescer() -> RequestCoalescer[ProcessPaymentResponse]:
+    """Get coalescer for concurrent payment retries."""
+    return app_state.payment_coalescer
 
 
-async def get_idempotency_store() -> IdempotencyStore:
-    """Get idempotency store."""
-    return app_state.redis_store
+async def get_command_publisher() -> CommandPublisher:
+    """Get the process-wide command publisher used by the v2 routes."""
+    if app_state.command_publisher is None:
+        raise RuntimeError("Command publisher is not connected")
+    return app_state.command_publisher
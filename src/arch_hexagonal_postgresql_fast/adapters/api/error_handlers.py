@@ -0,0 +1,39 @@
+"""Exception to HTTP response mapping for the API."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+
+from arch_hexagonal_postgresql_fast.adapters.payment_providers import exceptions as provider
+from arch_hexagonal_postgresql_fast.domain import exceptions as domain
+
+# Starlette resolves handlers along the exception MRO, so base classes act as
+# fallbacks for subclasses that are not listed explicitly.
+ERROR_STATUS_CODES: dict[type[Exception], int] = {
+    domain.DomainException: status.HTTP_400_BAD_REQUEST,
+    domain.PaymentNotFoundError: status.HTTP_404_NOT_FOUND,
+    domain.InvalidPaymentStateError: status.HTTP_409_CONFLICT,
+    domain.InsufficientFundsError: status.HTTP_402_PAYMENT_REQUIRED,
+    provider.PaymentProviderError: status.HTTP_502_BAD_GATEWAY,
+    provider.InsufficientFundsError: status.HTTP_402_PAYMENT_REQUIRED,
+    provider.InvalidPaymentMethodError: status.HTTP_400_BAD_REQUEST,
+    ValueError: status.HTTP_400_BAD_REQUEST,
+}
+
+
+def _json_error(status_code: int) -> Callable[[Request, Exception], Awaitable[JSONResponse]]:
+    """Build a handler that renders the exception message with a fixed status."""
+
+    async def handler(_request: Request, exc: Exception) -> JSONResponse:
+        return JSONResponse(status_code=status_code, content={"detail": str(exc)})
+
+    return handler
+
+
+def register_error_handlers(app: FastAPI) -> None:
+    """Register exception handlers for domain and provider errors."""
+    for exc_type, status_code in ERROR_STATUS_CODES.items():
+        app.add_exception_handler(exc_type, _json_error(status_code))
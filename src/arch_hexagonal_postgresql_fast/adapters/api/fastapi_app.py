@@ -6,20 +6,34 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from sqlalchemy.ext.asyncio import (
-    AsyncEngine,
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from arch_hexagonal_postgresql_fast.adapters.api.error_handlers import register_error_handlers
+from arch_hexagonal_postgresql_fast.adapters.api.routes import router
+from arch_hexagonal_postgresql_fast.adapters.api.routes_async import (
+    router as async_router,
+)
+from arch_hexagonal_postgresql_fast.adapters.api.state import app_state
+from arch_hexagonal_postgresql_fast.adapters.database.engine import create_engine
+from arch_hexagonal_postgresql_fast.adapters.database.outbox_listener import (
+    PostgreSQLOutboxListener,
+)
 from arch_hexagonal_postgresql_fast.adapters.database.session_outbox_repository import (
     SessionManagedOutboxRepository,
 )
 from arch_hexagonal_postgresql_fast.adapters.database.sqlalchemy_models import Base
+from arch_hexagonal_postgresql_fast.adapters.idempotency.caching_store import (
+    CachingIdempotencyStore,
+)
 from arch_hexagonal_postgresql_fast.adapters.idempotency.redis_store import (
     RedisIdempotencyStore,
 )
+from arch_hexagonal_postgresql_fast.adapters.messaging.rabbitmq_command_publisher import (
+    RabbitMQCommandPublisher,
+)
+from arch_hexagonal_postgresql_fast.adapters.messaging.rabbitmq_connection import (
+    RabbitMQConnectionManager,
+)
 from arch_hexagonal_postgresql_fast.adapters.messaging.rabbitmq_publisher import (
     RabbitMQEventPublisher,
 )
@@ -36,27 +50,10 @@ from arch_hexagonal_postgresql_fast.application.services.outbox_publisher import
     OutboxPublisherService,
 )
 from arch_hexagonal_postgresql_fast.config import Settings
+from arch_hexagonal_postgresql_fast.feature_flags import FeatureFlags
 from arch_hexagonal_postgresql_fast.workers.outbox_worker import OutboxWorker
 
 
-class AppState:
-    """Application state container."""
-
-    def __init__(self) -> None:
-        """Initialize app state."""
-        self.settings: Settings
-        self.engine: AsyncEngine
-        self.session_maker: async_sessionmaker[AsyncSession]
-        self.redis_store: RedisIdempotencyStore
-        self.event_publisher: RabbitMQEventPublisher
-        self.stripe_adapter: StripeAdapter | MockStripeAdapter | None = None
-        self.paypal_adapter: PayPalAdapter | None = None
-        self.outbox_worker: OutboxWorker | None = None
-
-
-app_state = AppState()
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     """Lifespan context manager for startup/shutdown."""
@@ -64,27 +61,43 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     app_state.settings = Settings()
 
     # Database
-    app_state.engine = create_async_engine(
-        app_state.settings.database_url,
-        echo=app_state.settings.debug,
-    )
+    settings = app_state.settings
+    app_state.engine = create_engine(settings)
     app_state.session_maker = async_sessionmaker(
         app_state.engine,
         class_=AsyncSession,
         expire_on_commit=False,
     )
 
-    # Create tables
-    async with app_state.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Alembic owns the schema; create_all is only for throwaway databases
+    if settings.auto_create_tables:
+        async with app_state.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
 
     # Redis
     app_state.redis_store = RedisIdempotencyStore(app_state.settings.redis_url)
     await app_state.redis_store.connect()
+    app_state.idempotency_store = CachingIdempotencyStore(
+        app_state.redis_store,
+        maxsize=settings.idempotency_cache_size,
+        ttl=settings.idempotency_cache_ttl_seconds,
+    )
 
-    # RabbitMQ
-    app_state.event_publisher = RabbitMQEventPublisher(app_state.settings.rabbitmq_url)
+    # RabbitMQ: both publishers open their channel on one shared connection
+    app_state.rabbitmq_connection = RabbitMQConnectionManager(app_state.settings.rabbitmq_url)
+    await app_state.rabbitmq_connection.connect()
+    app_state.event_publisher = RabbitMQEventPublisher(
+        app_state.settings.rabbitmq_url,
+        connection_manager=app_state.rabbitmq_connection,
+    )
     await app_state.event_publisher.connect()
+    if FeatureFlags.ENABLE_ASYNC_COMMANDS:
+        # One channel for the v2 routes instead of a channel per request
+        app_state.command_publisher = RabbitMQCommandPublisher(
+            app_state.settings.rabbitmq_url,
+            connection_manager=app_state.rabbitmq_connection,
+        )
+        await app_state.command_publisher.connect()
 
     # Payment providers
     if app_state.settings.stripe_enabled:
@@ -100,6 +113,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
             mode=app_state.settings.paypal_mode,
         )
 
+    # Provider lookup table used by get_payment_services
+    app_state.payment_providers = {
+        name: adapter
+        for name, adapter in (
+            ("stripe", app_state.stripe_adapter),
+            ("paypal", app_state.paypal_adapter),
+        )
+        if adapter is not None
+    }
+    app_state.default_payment_provider = app_state.payment_providers.get(
+        app_state.settings.default_payment_provider,
+        next(iter(app_state.payment_providers.values()), None),
+    )
+
     # Start outbox worker for background event publishing
     async def create_outbox_session() -> AsyncSession:
         return app_state.session_maker()
@@ -109,9 +136,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         outbox_repo=outbox_repo,
         event_publisher=app_state.event_publisher,
     )
+    if app_state.settings.outbox_listen_enabled:
+        app_state.outbox_listener = PostgreSQLOutboxListener(app_state.settings.database_url)
+        await app_state.outbox_listener.connect()
     app_state.outbox_worker = OutboxWorker(
         publisher_service=outbox_publisher,
-        interval_seconds=5,
+        interval_seconds=app_state.settings.outbox_poll_interval_seconds,
+        listener=app_state.outbox_listener,
     )
     await app_state.outbox_worker.start()
 
@@ -120,19 +151,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     # Shutdown
     if app_state.outbox_worker:
         await app_state.outbox_worker.stop()
+    if app_state.outbox_listener:
+        await app_state.outbox_listener.disconnect()
+    if isinstance(app_state.stripe_adapter, StripeAdapter):
+        await app_state.stripe_adapter.close()
+    if app_state.paypal_adapter:
+        await app_state.paypal_adapter.close()
     await app_state.redis_store.disconnect()
     await app_state.event_publisher.disconnect()
+    if app_state.command_publisher:
+        await app_state.command_publisher.disconnect()
+    await app_state.rabbitmq_connection.close()
     await app_state.engine.dispose()
 
 
 def create_app() -> FastAPI:
     """Create FastAPI application."""
-    from arch_hexagonal_postgresql_fast.adapters.api.routes import router
-    from arch_hexagonal_postgresql_fast.adapters.api.routes_async import (
-        router as async_router,
-    )
-    from arch_hexagonal_postgresql_fast.feature_flags import FeatureFlags
-
     app = FastAPI(
         title="Payment Service API",
         description="Hexagonal architecture payment processing service",
@@ -140,6 +174,9 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Domain and provider errors are mapped to HTTP statuses in one place
+    register_error_handlers(app)
+
     # V1 routes (synchronous, backward compatible) - already has /api/v1 prefix in router
     app.include_router(router)
 
@@ -2,36 +2,23 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from decimal import Decimal
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, status
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from arch_hexagonal_postgresql_fast.adapters.api.dependencies import (
-    get_event_publisher,
-    get_idempotency_store,
-    get_outbox_repository,
-    get_payment_provider,
-    get_payment_repository,
-    get_transaction_repository,
+    PaymentServices,
+    get_payment_coalescer,
+    get_payment_services,
+    get_uow,
+    open_uow,
 )
-from arch_hexagonal_postgresql_fast.application.ports.event_publisher import (
-    EventPublisher,
-)
-from arch_hexagonal_postgresql_fast.application.ports.idempotency_store import (
-    IdempotencyStore,
-)
-from arch_hexagonal_postgresql_fast.application.ports.outbox_repository import (
-    OutboxRepository,
-)
-from arch_hexagonal_postgresql_fast.application.ports.payment_provider import (
-    PaymentProvider,
-)
-from arch_hexagonal_postgresql_fast.application.ports.payment_repository import (
-    PaymentRepository,
-)
-from arch_hexagonal_postgresql_fast.application.ports.transaction_repository import (
-    TransactionRepository,
+from arch_hexagonal_postgresql_fast.application.ports.unit_of_work import UnitOfWork
+from arch_hexagonal_postgresql_fast.application.services.request_coalescer import (
+    RequestCoalescer,
 )
 from arch_hexagonal_postgresql_fast.application.use_cases.get_transaction_status import (
     GetTransactionStatus,
@@ -40,11 +27,13 @@ from arch_hexagonal_postgresql_fast.application.use_cases.get_transaction_status
 from arch_hexagonal_postgresql_fast.application.use_cases.process_payment import (
     ProcessPayment,
     ProcessPaymentRequest,
+    ProcessPaymentResponse,
 )
 from arch_hexagonal_postgresql_fast.application.use_cases.refund_payment import (
     RefundPayment,
     RefundPaymentRequest,
 )
+from arch_hexagonal_postgresql_fast.domain.exceptions import PaymentNotFoundError
 from arch_hexagonal_postgresql_fast.domain.value_objects.amount import Amount
 from arch_hexagonal_postgresql_fast.domain.value_objects.payment_method import (
     PaymentMethod,
@@ -52,13 +41,22 @@ from arch_hexagonal_postgresql_fast.domain.value_objects.payment_method import (
 
 router = APIRouter(prefix="/api/v1", tags=["payments"])
 
+# Single constrained type so pydantic-core checks length and alphabet in one pass
+CurrencyCode = Annotated[str, StringConstraints(min_length=3, max_length=3, pattern=r"^[A-Z]{3}$")]
+
+# Request bodies are read once and never mutated: reject unknown keys up front
+# and freeze the parsed model.
+REQUEST_MODEL_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
 
 class ProcessPaymentSchema(BaseModel):
     """Schema for processing payment."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     customer_id: str = Field(..., description="Customer identifier")
     amount: Decimal = Field(..., gt=0, description="Payment amount")
-    currency: str = Field(..., min_length=3, max_length=3, description="Currency code")
+    currency: CurrencyCode = Field(..., description="Currency code")
     payment_method: PaymentMethod = Field(..., description="Payment method type")
     payment_method_token: str = Field(..., description="Payment method token")
     idempotency_key: str = Field(..., description="Idempotency key")
@@ -69,149 +67,169 @@ class ProcessPaymentSchema(BaseModel):
 class RefundPaymentSchema(BaseModel):
     """Schema for refunding payment."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     amount: Decimal | None = Field(None, gt=0, description="Refund amount (None for full)")
     idempotency_key: str | None = Field(None, description="Idempotency key")
 
 
-@router.post("/payments", status_code=status.HTTP_201_CREATED)
+# Response models: with a declared return type FastAPI serializes straight to
+# JSON bytes in pydantic-core, including datetimes, without a jsonable_encoder pass.
+
+
+class PaymentResponseSchema(BaseModel):
+    """Schema for a processed payment."""
+
+    payment_id: str
+    status: str
+    provider_transaction_id: str = ""
+    created_at: datetime
+
+
+class RefundResponseSchema(BaseModel):
+    """Schema for a processed refund."""
+
+    payment_id: str
+    refund_amount: str
+    status: str
+    refund_transaction_id: str
+    created_at: datetime
+
+
+class TransactionSchema(BaseModel):
+    """Schema for a payment transaction."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    type: str
+    amount: str
+    status: str
+    provider_transaction_id: str | None
+    created_at: datetime
+
+
+class PaymentStatusSchema(BaseModel):
+    """Schema for payment status with its transactions."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    payment_id: str
+    customer_id: str
+    total_amount: str
+    refunded_amount: str
+    status: str
+    transactions: list[TransactionSchema]
+
+
+@router.post(
+    "/payments",
+    status_code=status.HTTP_201_CREATED,
+    response_model=PaymentResponseSchema,
+)
 async def process_payment(
     request: ProcessPaymentSchema,
-    payment_repo: PaymentRepository = Depends(get_payment_repository),
-    transaction_repo: TransactionRepository = Depends(get_transaction_repository),
-    provider: PaymentProvider = Depends(get_payment_provider),
-    events: EventPublisher = Depends(get_event_publisher),
-    idempotency: IdempotencyStore = Depends(get_idempotency_store),
-    outbox_repo: OutboxRepository = Depends(get_outbox_repository),
-) -> dict[str, str]:
-    """Process a payment."""
-    try:
-        use_case = ProcessPayment(
-            payment_repo,
-            transaction_repo,
-            provider,
-            events,
-            idempotency,
-            outbox_repo,
-        )
-
-        result = await use_case.execute(
-            ProcessPaymentRequest(
-                customer_id=request.customer_id,
-                amount=Amount(value=request.amount, currency=request.currency),
-                payment_method=request.payment_method,
-                payment_method_token=request.payment_method_token,
-                idempotency_key=request.idempotency_key,
-                metadata=request.metadata,
+    services: PaymentServices = Depends(get_payment_services),
+    coalescer: RequestCoalescer[ProcessPaymentResponse] = Depends(get_payment_coalescer),
+) -> PaymentResponseSchema:
+    """Process a payment.
+
+    Concurrent retries with the same idempotency key inside this process
+    share one execution instead of each consulting Redis.
+    """
+    payment_request = ProcessPaymentRequest(
+        customer_id=request.customer_id,
+        amount=Amount(value=request.amount, currency=request.currency),
+        payment_method=request.payment_method,
+        payment_method_token=request.payment_method_token,
+        idempotency_key=request.idempotency_key,
+        metadata=request.metadata,
+    )
+
+    async def execute() -> ProcessPaymentResponse:
+        # The shared execution outlives this request if its client goes away
+        # while others still wait on it, so it cannot use the request-scoped
+        # session: it opens and closes its own.
+        async with open_uow() as uow:
+            use_case = ProcessPayment(
+                uow.payments,
+                uow.transactions,
+                services.provider,
+                services.events,
+                services.idempotency,
+                uow.outbox,
             )
-        )
+            return await use_case.execute(payment_request)
+
+    result = await coalescer.run(request.idempotency_key, execute)
 
-        return {
-            "payment_id": result.payment_id,
-            "status": result.status,
-            "provider_transaction_id": result.provider_transaction_id or "",
-            "created_at": result.created_at.isoformat(),
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
+    return PaymentResponseSchema(
+        payment_id=result.payment_id,
+        status=result.status,
+        provider_transaction_id=result.provider_transaction_id or "",
+        created_at=result.created_at,
+    )
 
 
-@router.post("/payments/{payment_id}/refund")
+@router.post("/payments/{payment_id}/refund", response_model=RefundResponseSchema)
 async def refund_payment(
     payment_id: str,
     request: RefundPaymentSchema,
-    payment_repo: PaymentRepository = Depends(get_payment_repository),
-    transaction_repo: TransactionRepository = Depends(get_transaction_repository),
-    provider: PaymentProvider = Depends(get_payment_provider),
-    events: EventPublisher = Depends(get_event_publisher),
-    idempotency: IdempotencyStore = Depends(get_idempotency_store),
-    outbox_repo: OutboxRepository = Depends(get_outbox_repository),
-) -> dict[str, str]:
+    uow: UnitOfWork = Depends(get_uow),
+    services: PaymentServices = Depends(get_payment_services),
+) -> RefundResponseSchema:
     """Refund a payment."""
-    try:
-        use_case = RefundPayment(
-            payment_repo,
-            transaction_repo,
-            provider,
-            events,
-            idempotency,
-            outbox_repo,
+    use_case = RefundPayment(
+        uow.payments,
+        uow.transactions,
+        services.provider,
+        services.events,
+        services.idempotency,
+        uow.outbox,
+    )
+
+    # Get payment to determine currency
+    payment = await uow.payments.get_by_id(payment_id)
+    if not payment:
+        raise PaymentNotFoundError(f"Payment {payment_id} not found")
+
+    refund_amount = None
+    if request.amount:
+        refund_amount = Amount(
+            value=request.amount,
+            currency=payment.amount.currency,
         )
 
-        # Get payment to determine currency
-        payment = await payment_repo.get_by_id(payment_id)
-        if not payment:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Payment {payment_id} not found",
-            )
+    # No commit here: the use case persists the refund with
+    # payments.save_with_outbox, which commits by contract
+    result = await use_case.execute(
+        RefundPaymentRequest(
+            payment_id=payment_id,
+            amount=refund_amount,
+            idempotency_key=request.idempotency_key,
+        )
+    )
 
-        refund_amount = None
-        if request.amount:
-            refund_amount = Amount(
-                value=request.amount,
-                currency=payment.amount.currency,
-            )
+    return RefundResponseSchema(
+        payment_id=result.payment_id,
+        refund_amount=result.refund_amount,
+        status=result.status,
+        refund_transaction_id=result.refund_transaction_id,
+        created_at=result.created_at,
+    )
 
-        result = await use_case.execute(
-            RefundPaymentRequest(
-                payment_id=payment_id,
-                amount=refund_amount,
-                idempotency_key=request.idempotency_key,
-            )
-        )
 
-        return {
-            "payment_id": result.payment_id,
-            "refund_amount": result.refund_amount,
-            "status": result.status,
-            "refund_transaction_id": result.refund_transaction_id,
-            "created_at": result.created_at.isoformat(),
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        ) from e
-
-
-@router.get("/payments/{payment_id}")
+@router.get("/payments/{payment_id}", response_model=PaymentStatusSchema)
 async def get_payment_status(
     payment_id: str,
-    payment_repo: PaymentRepository = Depends(get_payment_repository),
-    transaction_repo: TransactionRepository = Depends(get_transaction_repository),
-) -> dict[str, object]:
+    uow: UnitOfWork = Depends(get_uow),
+) -> PaymentStatusSchema:
     """Get payment status."""
-    try:
-        use_case = GetTransactionStatus(payment_repo, transaction_repo)
-
-        result = await use_case.execute(GetTransactionStatusRequest(payment_id=payment_id))
-
-        return {
-            "payment_id": result.payment_id,
-            "customer_id": result.customer_id,
-            "total_amount": result.total_amount,
-            "refunded_amount": result.refunded_amount,
-            "status": result.status,
-            "transactions": [
-                {
-                    "id": tx.id,
-                    "type": tx.type,
-                    "amount": tx.amount,
-                    "status": tx.status,
-                    "provider_transaction_id": tx.provider_transaction_id,
-                    "created_at": tx.created_at.isoformat(),
-                }
-                for tx in result.transactions
-            ],
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
+    use_case = GetTransactionStatus(uow.payments, uow.transactions)
+
+    result = await use_case.execute(GetTransactionStatusRequest(payment_id=payment_id))
+
+    return PaymentStatusSchema.model_validate(result)
 
 
 @router.get("/health")
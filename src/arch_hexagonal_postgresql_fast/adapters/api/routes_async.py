@@ -9,23 +9,31 @@ from decimal import Decimal
 from fastapi import APIRouter, Depends, status
 from pydantic import BaseModel, Field
 
+from arch_hexagonal_postgresql_fast.adapters.api.dependencies import get_command_publisher
+from arch_hexagonal_postgresql_fast.adapters.api.routes import (
+    REQUEST_MODEL_CONFIG,
+    CurrencyCode,
+)
 from arch_hexagonal_postgresql_fast.application.commands import (
     ProcessPaymentCommand,
 )
 from arch_hexagonal_postgresql_fast.application.ports.command_publisher import (
     CommandPublisher,
 )
-from arch_hexagonal_postgresql_fast.feature_flags import FeatureFlags
 
+# Only mounted by create_app when FeatureFlags.ENABLE_ASYNC_COMMANDS is on,
+# so the handlers do not re-check the flag per request.
 router = APIRouter(prefix="/v2", tags=["payments-v2"])
 
 
 class AsyncPaymentRequest(BaseModel):
     """Request schema for async payment processing."""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     customer_id: str = Field(..., description="Customer identifier")
     amount: Decimal = Field(..., gt=0, description="Payment amount")
-    currency: str = Field(..., min_length=3, max_length=3, description="Currency code")
+    currency: CurrencyCode = Field(..., description="Currency code")
     payment_method: str = Field(..., description="Payment method type")
     payment_method_token: str = Field(..., description="Payment method token")
     idempotency_key: str = Field(..., description="Idempotency key for deduplication")
@@ -48,7 +56,7 @@ class AsyncPaymentResponse(BaseModel):
 )
 async def create_payment_async(
     request: AsyncPaymentRequest,
-    command_publisher: CommandPublisher = Depends(),
+    command_publisher: CommandPublisher = Depends(get_command_publisher),
 ) -> AsyncPaymentResponse:
     """Create payment asynchronously via command queue.
 
@@ -63,16 +71,8 @@ async def create_payment_async(
         Response with command_id for status polling
 
     """
-    if not FeatureFlags.ENABLE_ASYNC_COMMANDS:
-        from fastapi import HTTPException
-
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Async processing is not enabled. Use /v1/payments endpoint.",
-        )
-
-    # Create command
-    command_id = str(uuid.uuid4())
+    # Create command (UUIDv7: time-ordered, index-friendly)
+    command_id = str(uuid.uuid7())
     command = ProcessPaymentCommand(
         command_id=command_id,
         idempotency_key=request.idempotency_key,
@@ -0,0 +1,71 @@
+"""Process-wide application state shared by the app factory and dependencies."""
+
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from arch_hexagonal_postgresql_fast.adapters.database.outbox_listener import (
+    PostgreSQLOutboxListener,
+)
+from arch_hexagonal_postgresql_fast.adapters.idempotency.redis_store import (
+    RedisIdempotencyStore,
+)
+from arch_hexagonal_postgresql_fast.adapters.messaging.rabbitmq_command_publisher import (
+    RabbitMQCommandPublisher,
+)
+from arch_hexagonal_postgresql_fast.adapters.messaging.rabbitmq_connection import (
+    RabbitMQConnectionManager,
+)
+from arch_hexagonal_postgresql_fast.adapters.messaging.rabbitmq_publisher import (
+    RabbitMQEventPublisher,
+)
+from arch_hexagonal_postgresql_fast.adapters.payment_providers.mock_stripe_adapter import (
+    MockStripeAdapter,
+)
+from arch_hexagonal_postgresql_fast.adapters.payment_providers.paypal_adapter import (
+    PayPalAdapter,
+)
+from arch_hexagonal_postgresql_fast.adapters.payment_providers.stripe_adapter import (
+    StripeAdapter,
+)
+from arch_hexagonal_postgresql_fast.application.ports.idempotency_store import (
+    IdempotencyStore,
+)
+from arch_hexagonal_postgresql_fast.application.ports.payment_provider import (
+    PaymentProvider,
+)
+from arch_hexagonal_postgresql_fast.application.services.request_coalescer import (
+    RequestCoalescer,
+)
+from arch_hexagonal_postgresql_fast.application.use_cases.process_payment import (
+    ProcessPaymentResponse,
+)
+from arch_hexagonal_postgresql_fast.config import Settings
+from arch_hexagonal_postgresql_fast.workers.outbox_worker import OutboxWorker
+
+
+class AppState:
+    """Application state container."""
+
+    def __init__(self) -> None:
+        """Initialize app state."""
+        self.settings: Settings
+        self.engine: AsyncEngine
+        self.session_maker: async_sessionmaker[AsyncSession]
+        self.redis_store: RedisIdempotencyStore
+        self.idempotency_store: IdempotencyStore
+        self.rabbitmq_connection: RabbitMQConnectionManager
+        self.event_publisher: RabbitMQEventPublisher
+        self.command_publisher: RabbitMQCommandPublisher | None = None
+        self.stripe_adapter: StripeAdapter | MockStripeAdapter | None = None
+        self.paypal_adapter: PayPalAdapter | None = None
+        self.payment_providers: dict[str, PaymentProvider] = {}
+        self.default_payment_provider: PaymentProvider | None = None
+        self.payment_coalescer: RequestCoalescer[ProcessPaymentResponse] = RequestCoalescer()
+        self.outbox_listener: PostgreSQLOutboxListener | None = None
+        self.outbox_worker: OutboxWorker | None = None
+
+
+# Single instance per process. Kept out of fastapi_app so that dependencies
+# and routes can import it without re-entering the app factory module.
+app_state = AppState()
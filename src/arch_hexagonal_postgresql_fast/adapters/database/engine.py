@@ -0,0 +1,68 @@
+"""AsyncEngine construction shared by the API and the workers."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from arch_hexagonal_postgresql_fast.config import Settings
+
+from .json_codec import json_deserializer, json_serializer, register_json_codecs
+
+
+def asyncpg_url(database_url: str) -> URL:
+    """Pin a PostgreSQL URL to the asyncpg driver.
+
+    Plain ``postgresql://`` DSNs (as handed out by most hosting platforms)
+    would otherwise select a sync driver that AsyncEngine cannot use.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "postgresql" and url.get_driver_name() != "asyncpg":
+        url = url.set(drivername="postgresql+asyncpg")
+    return url
+
+
+def create_engine(settings: Settings) -> AsyncEngine:
+    """Create the AsyncEngine described by settings."""
+    engine = _create_engine(settings)
+    register_json_codecs(engine)
+    return engine
+
+
+def _create_engine(settings: Settings) -> AsyncEngine:
+    url = asyncpg_url(settings.database_url)
+    if settings.db_pgbouncer:
+        # PgBouncer (transaction mode) owns pooling and cannot track
+        # server-side prepared statements across client connections
+        return create_async_engine(
+            url,
+            echo=settings.debug,
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
+            poolclass=NullPool,
+            connect_args={
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            },
+        )
+    return create_async_engine(
+        url,
+        echo=settings.debug,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        # Pooled connections live long enough for every hot statement to be
+        # parsed and planned once, then reused from these caches
+        connect_args={
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        },
+    )
@@ -0,0 +1,72 @@
+"""msgspec-backed JSON codecs for SQLAlchemy JSON columns on asyncpg."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import msgspec
+from sqlalchemy import event
+
+if TYPE_CHECKING:
+    import asyncpg  # type: ignore[import-untyped]
+    from sqlalchemy.engine.interfaces import AdaptedConnection
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.pool import ConnectionPoolEntry
+
+# enc_hook=str mirrors json.dumps(..., default=str) for values msgspec
+# cannot encode natively.
+_encoder = msgspec.json.Encoder(enc_hook=str)
+_decoder = msgspec.json.Decoder()
+
+# Version byte that prefixes jsonb values in PostgreSQL's binary format
+_JSONB_VERSION = b"\x01"
+
+
+def json_serializer(value: object) -> bytes:
+    """Encode a JSON column value to the bytes sent by the codecs below."""
+    return _encoder.encode(value)
+
+
+def json_deserializer(value: str | bytes | memoryview) -> object:
+    """Decode a JSON column value."""
+    return _decoder.decode(value)
+
+
+def _encode_jsonb(value: bytes) -> bytes:
+    return _JSONB_VERSION + value
+
+
+def _decode_jsonb(value: bytes) -> object:
+    # memoryview slice: the version byte is skipped without copying the value
+    return _decoder.decode(memoryview(value)[1:])
+
+
+async def _set_type_codecs(connection: asyncpg.Connection) -> None:
+    await connection.set_type_codec(
+        "json",
+        encoder=bytes,
+        decoder=json_deserializer,
+        schema="pg_catalog",
+        format="binary",
+    )
+    await connection.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
+
+
+def register_json_codecs(engine: AsyncEngine) -> None:
+    """Replace SQLAlchemy's asyncpg JSON codecs with bytes-only ones.
+
+    The dialect's codecs expect ``str`` from the serializer and hand ``str``
+    to the deserializer, which costs a decode/encode round trip per value.
+    These pass msgspec's bytes straight through. Registered on "connect", so
+    they run after (and override) the dialect's own setup.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection: AdaptedConnection, _record: ConnectionPoolEntry) -> None:
+        dbapi_connection.run_async(_set_type_codecs)
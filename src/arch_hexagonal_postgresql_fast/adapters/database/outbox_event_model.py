@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid7
 
-from sqlalchemy import DateTime, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSON as PGJSON
+from sqlalchemy import DDL, DateTime, Index, Integer, String, Text, event, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -17,15 +17,68 @@ class OutboxEventModel(Base):
     """Outbox event table for Transactional Outbox Pattern."""
 
     __tablename__ = "outbox_events"
+    # Partial indexes: published rows drop out, so both stay as small as the
+    # backlog rather than the table. Kept in step with the Alembic migrations.
+    __table_args__ = (
+        Index(
+            "idx_outbox_unpublished",
+            "created_at",
+            postgresql_include=["id", "attempts"],
+            postgresql_where=text("published_at IS NULL"),
+        ),
+        Index(
+            "idx_outbox_failed",
+            "attempts",
+            postgresql_where=text("published_at IS NULL"),
+        ),
+    )
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    # Time-ordered ids make primary key inserts append-mostly
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid7)
     aggregate_type: Mapped[str] = mapped_column(String(100), nullable=False)
     aggregate_id: Mapped[str] = mapped_column(String(100), nullable=False)
     event_type: Mapped[str] = mapped_column(String(100), nullable=False)
-    payload: Mapped[dict[str, object]] = mapped_column(PGJSON, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    payload: Mapped[dict[str, object]] = mapped_column(JSONB, nullable=False)
+    # Stamped by the database so ordering does not depend on app-server clocks.
+    # clock_timestamp() rather than now(): rows inserted by one transaction
+    # keep distinct, increasing values and so their relative order.
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.clock_timestamp()
+    )
     published_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True, default=None
     )
     attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True, default=None)
+
+
+# Same NOTIFY trigger as migration 002, so databases built with create_all
+# (AUTO_CREATE_TABLES) wake the outbox listener too instead of leaving the
+# worker on its fallback poll.
+_CREATE_NOTIFY_FUNCTION = DDL(  # type: ignore[no-untyped-call]
+    """
+    CREATE OR REPLACE FUNCTION outbox_notify() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('outbox_new', '');
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+_CREATE_NOTIFY_TRIGGER = DDL(  # type: ignore[no-untyped-call]
+    """
+    CREATE TRIGGER outbox_events_notify
+    AFTER INSERT ON outbox_events
+    FOR EACH ROW EXECUTE FUNCTION outbox_notify()
+    """
+)
+event.listen(
+    OutboxEventModel.__table__,
+    "after_create",
+    _CREATE_NOTIFY_FUNCTION.execute_if(dialect="postgresql"),
+)
+event.listen(
+    OutboxEventModel.__table__,
+    "after_create",
+    _CREATE_NOTIFY_TRIGGER.execute_if(dialect="postgresql"),
+)
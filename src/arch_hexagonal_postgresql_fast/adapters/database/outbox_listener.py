@@ -0,0 +1,68 @@
+"""PostgreSQL LISTEN/NOTIFY implementation of OutboxListener."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import asyncpg  # type: ignore[import-untyped]
+from sqlalchemy.engine import make_url
+
+logger = logging.getLogger(__name__)
+
+# Must match the channel used by the outbox_notify() trigger (migration 002)
+OUTBOX_CHANNEL = "outbox_new"
+
+
+class PostgreSQLOutboxListener:
+    """Listens on the outbox notification channel over a dedicated connection.
+
+    LISTEN needs a session-level connection, so this bypasses the SQLAlchemy
+    pool (and PgBouncer in transaction mode) and connects with asyncpg directly.
+    """
+
+    def __init__(self, database_url: str) -> None:
+        """Initialize listener with a SQLAlchemy-style database URL."""
+        self._url = make_url(database_url)
+        self._connection: asyncpg.Connection | None = None
+        self._notified = asyncio.Event()
+
+    async def connect(self) -> None:
+        """Open the listening connection."""
+        self._connection = await asyncpg.connect(
+            host=self._url.host,
+            port=self._url.port,
+            user=self._url.username,
+            password=self._url.password,
+            database=self._url.database,
+        )
+        await self._connection.add_listener(OUTBOX_CHANNEL, self._on_notify)
+        logger.info("Listening for outbox notifications on %s", OUTBOX_CHANNEL)
+
+    async def disconnect(self) -> None:
+        """Close the listening connection."""
+        if self._connection and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+    async def wait_for_events(self, timeout: float) -> bool:
+        """Wait for a notification, falling back to a plain timeout."""
+        if self._connection is None or self._connection.is_closed():
+            try:
+                await self.connect()
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning("Outbox listener unavailable, polling instead: %s", e)
+                await asyncio.sleep(timeout)
+                return False
+
+        try:
+            await asyncio.wait_for(self._notified.wait(), timeout)
+        except TimeoutError:
+            return False
+        finally:
+            self._notified.clear()
+        return True
+
+    def _on_notify(self, *_: object) -> None:
+        """Wake waiters; the payload is ignored since the worker reads in batches."""
+        self._notified.set()
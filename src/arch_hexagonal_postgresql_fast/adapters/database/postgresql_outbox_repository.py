@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import cast
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Table, bindparam, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from arch_hexagonal_postgresql_fast.application.ports.outbox_repository import (
@@ -15,6 +17,71 @@ from arch_hexagonal_postgresql_fast.application.ports.outbox_repository import (
 
 from .outbox_event_model import OutboxEventModel
 
+_outbox = cast("Table", OutboxEventModel.__table__)
+
+# Column order matches the OutboxEvent constructor so rows unpack directly
+# into events without ORM instances in between.
+_EVENT_COLUMNS = (
+    _outbox.c.id,
+    _outbox.c.aggregate_type,
+    _outbox.c.aggregate_id,
+    _outbox.c.event_type,
+    _outbox.c.payload,
+    _outbox.c.created_at,
+    _outbox.c.published_at,
+    _outbox.c.attempts,
+    _outbox.c.last_error,
+)
+_SELECT_UNPUBLISHED = (
+    select(*_EVENT_COLUMNS)
+    .where(
+        _outbox.c.published_at.is_(None),
+        _outbox.c.attempts < bindparam("max_attempts"),
+    )
+    .order_by(_outbox.c.created_at)
+    .limit(bindparam("limit"))
+    .with_for_update(skip_locked=True)
+)
+_STREAM_UNPUBLISHED = _SELECT_UNPUBLISHED.execution_options(yield_per=100)
+_SELECT_FAILED = (
+    select(*_EVENT_COLUMNS)
+    .where(
+        _outbox.c.attempts >= bindparam("max_attempts"),
+        _outbox.c.published_at.is_(None),
+    )
+    .order_by(_outbox.c.created_at)
+    # Streamed through a server-side cursor, 500 rows per fetch.
+    .execution_options(yield_per=500)
+)
+# Monitoring only needs the number: no payload transferred or decoded
+_COUNT_FAILED = (
+    select(func.count())
+    .select_from(_outbox)
+    .where(
+        _outbox.c.attempts >= bindparam("max_attempts"),
+        _outbox.c.published_at.is_(None),
+    )
+)
+
+# Built once at import: SQLAlchemy's compiled cache then serves the SQL text
+# for every call, and asyncpg reuses one prepared statement per connection.
+_INSERT_EVENT = insert(_outbox)
+# Single-statement updates: no SELECT, no ORM instance, and the attempts
+# increment happens server-side so concurrent failures cannot lose a count.
+_MARK_PUBLISHED = (
+    update(_outbox).where(_outbox.c.id == bindparam("event_id")).values(published_at=func.now())
+)
+_MARK_PUBLISHED_MANY = (
+    update(_outbox)
+    .where(_outbox.c.id == func.any(bindparam("event_ids")))
+    .values(published_at=func.now())
+)
+_INCREMENT_ATTEMPTS = (
+    update(_outbox)
+    .where(_outbox.c.id == bindparam("event_id"))
+    .values(attempts=_outbox.c.attempts + 1, last_error=bindparam("error"))
+)
+
 
 class PostgreSQLOutboxRepository(OutboxRepository):
     """PostgreSQL implementation of OutboxRepository using SQLAlchemy."""
@@ -25,77 +92,87 @@ class PostgreSQLOutboxRepository(OutboxRepository):
 
     async def save(self, event: OutboxEvent) -> None:
         """Save outbox event to database."""
-        model = OutboxEventModel(
-            id=event.id,
-            aggregate_type=event.aggregate_type,
-            aggregate_id=event.aggregate_id,
-            event_type=event.event_type,
-            payload=event.payload,
-            created_at=event.created_at,
-            published_at=event.published_at,
-            attempts=event.attempts,
-            last_error=event.last_error,
+        await self._session.execute(_INSERT_EVENT, self._event_params(event))
+
+    async def save_many(self, events: list[OutboxEvent]) -> None:
+        """Save outbox events with one executemany round trip."""
+        if not events:
+            return
+        await self._session.execute(_INSERT_EVENT, [self._event_params(event) for event in events])
+
+    async def get_unpublished(self, limit: int = 100, max_attempts: int = 5) -> list[OutboxEvent]:
+        """Get unpublished events ordered by creation time.
+
+        Rows locked by a concurrent worker are skipped rather than waited on,
+        so several publishers can drain the outbox side by side.
+        """
+        result = await self._session.execute(
+            _SELECT_UNPUBLISHED, {"limit": limit, "max_attempts": max_attempts}
         )
-        self._session.add(model)
-        await self._session.flush()
-
-    async def get_unpublished(self, limit: int = 100) -> list[OutboxEvent]:
-        """Get unpublished events ordered by creation time."""
-        stmt = (
-            select(OutboxEventModel)
-            .where(OutboxEventModel.published_at.is_(None))
-            .order_by(OutboxEventModel.created_at)
-            .limit(limit)
+        return [OutboxEvent(*row) for row in result]
+
+    async def iter_unpublished(
+        self, limit: int = 100, max_attempts: int = 5
+    ) -> AsyncIterator[OutboxEvent]:
+        """Stream unpublished events, locking rows as they are fetched."""
+        result = await self._session.stream(
+            _STREAM_UNPUBLISHED, {"limit": limit, "max_attempts": max_attempts}
         )
-        result = await self._session.execute(stmt)
-        models = result.scalars().all()
-
-        return [self._to_domain(model) for model in models]
+        async for row in result:
+            yield OutboxEvent(*row)
 
     async def mark_published(self, event_id: UUID) -> None:
         """Mark event as successfully published."""
-        stmt = select(OutboxEventModel).where(OutboxEventModel.id == event_id)
-        result = await self._session.execute(stmt)
-        model = result.scalar_one()
+        await self._session.execute(_MARK_PUBLISHED, {"event_id": event_id})
 
-        model.published_at = datetime.now(UTC)
-        await self._session.flush()
+    async def mark_published_many(self, event_ids: list[UUID]) -> None:
+        """Mark events as published with a single UPDATE."""
+        if event_ids:
+            await self._session.execute(_MARK_PUBLISHED_MANY, {"event_ids": event_ids})
 
     async def increment_attempts(self, event_id: UUID, error: str) -> None:
         """Increment retry attempts and record error."""
-        stmt = select(OutboxEventModel).where(OutboxEventModel.id == event_id)
-        result = await self._session.execute(stmt)
-        model = result.scalar_one()
+        await self._session.execute(_INCREMENT_ATTEMPTS, {"event_id": event_id, "error": error})
+
+    async def increment_attempts_many(self, failures: list[tuple[UUID, str]]) -> None:
+        """Increment attempts for several events with one executemany round trip."""
+        if not failures:
+            return
+        await self._session.execute(
+            _INCREMENT_ATTEMPTS,
+            [{"event_id": event_id, "error": error} for event_id, error in failures],
+        )
 
-        model.attempts += 1
-        model.last_error = error
-        await self._session.flush()
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[OutboxRepository]:
+        """Yield this repository; the session's owner controls the transaction."""
+        yield self
 
     async def get_failed(self, max_attempts: int = 5) -> list[OutboxEvent]:
         """Get events that exceeded max retry attempts."""
-        stmt = (
-            select(OutboxEventModel)
-            .where(
-                OutboxEventModel.attempts >= max_attempts,
-                OutboxEventModel.published_at.is_(None),
-            )
-            .order_by(OutboxEventModel.created_at)
-        )
-        result = await self._session.execute(stmt)
-        models = result.scalars().all()
-
-        return [self._to_domain(model) for model in models]
-
-    def _to_domain(self, model: OutboxEventModel) -> OutboxEvent:
-        """Convert SQLAlchemy model to domain OutboxEvent."""
-        return OutboxEvent(
-            id=model.id,
-            aggregate_type=model.aggregate_type,
-            aggregate_id=model.aggregate_id,
-            event_type=model.event_type,
-            payload=model.payload,
-            created_at=model.created_at,
-            published_at=model.published_at,
-            attempts=model.attempts,
-            last_error=model.last_error,
-        )
+        return [event async for event in self.iter_failed(max_attempts)]
+
+    async def iter_failed(self, max_attempts: int = 5) -> AsyncIterator[OutboxEvent]:
+        """Stream events that exceeded max retry attempts."""
+        result = await self._session.stream(_SELECT_FAILED, {"max_attempts": max_attempts})
+        async for row in result:
+            yield OutboxEvent(*row)
+
+    async def count_failed(self, max_attempts: int = 5) -> int:
+        """Count events that exceeded max retry attempts."""
+        result = await self._session.execute(_COUNT_FAILED, {"max_attempts": max_attempts})
+        return result.scalar_one()
+
+    @staticmethod
+    def _event_params(event: OutboxEvent) -> dict[str, object]:
+        """Bind parameters for the outbox insert; created_at is set by the database."""
+        return {
+            "id": event.id,
+            "aggregate_type": event.aggregate_type,
+            "aggregate_id": event.aggregate_id,
+            "event_type": event.event_type,
+            "payload": event.payload,
+            "published_at": event.published_at,
+            "attempts": event.attempts,
+            "last_error": event.last_error,
+        }
@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from decimal import Decimal
+from typing import Any, cast
 
-from sqlalchemy import select
+from sqlalchemy import Table, bindparam, delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from arch_hexagonal_postgresql_fast.adapters.database.outbox_event_model import (
+    OutboxEventModel,
+)
 from arch_hexagonal_postgresql_fast.adapters.database.sqlalchemy_models import (
     PaymentModel,
+    TransactionModel,
+)
+from arch_hexagonal_postgresql_fast.application.ports.outbox_repository import (
+    OutboxEvent,
 )
 from arch_hexagonal_postgresql_fast.domain.entities.payment import Payment
+from arch_hexagonal_postgresql_fast.domain.entities.transaction import Transaction
 from arch_hexagonal_postgresql_fast.domain.value_objects.amount import Amount
 from arch_hexagonal_postgresql_fast.domain.value_objects.payment_method import (
     PaymentMethod,
@@ -18,6 +29,71 @@ from arch_hexagonal_postgresql_fast.domain.value_objects.payment_method import (
 from arch_hexagonal_postgresql_fast.domain.value_objects.transaction_status import (
     TransactionStatus,
 )
+from arch_hexagonal_postgresql_fast.feature_flags import FeatureFlags
+
+_payments = cast("Table", PaymentModel.__table__)
+
+# Plain dict lookups for row hydration instead of going through EnumType.__call__
+_STATUSES = {status.value: status for status in TransactionStatus}
+_PAYMENT_METHODS = {method.value: method for method in PaymentMethod}
+
+# Reads go through Core against the table: rows map straight to entities
+# without ORM instance state, and the constant SQL text keeps a single
+# prepared statement per connection in asyncpg's statement cache.
+# Rows are unpacked by position in _row_to_entity, which must follow this order.
+_PAYMENT_COLUMNS = (
+    _payments.c.id,
+    _payments.c.customer_id,
+    _payments.c.amount_value,
+    _payments.c.amount_currency,
+    _payments.c.payment_method,
+    _payments.c.provider,
+    _payments.c.status,
+    _payments.c.provider_transaction_id,
+    _payments.c.refunded_amount_value,
+    _payments.c.refunded_amount_currency,
+    _payments.c.created_at,
+    _payments.c.updated_at,
+    _payments.c.payment_metadata,
+)
+_SELECT_BY_ID = select(*_PAYMENT_COLUMNS).where(_payments.c.id == bindparam("payment_id"))
+_SELECT_BY_CUSTOMER = select(*_PAYMENT_COLUMNS).where(
+    _payments.c.customer_id == bindparam("customer_id")
+)
+_DELETE_BY_ID = delete(_payments).where(_payments.c.id == bindparam("payment_id"))
+
+_transactions = cast("Table", TransactionModel.__table__)
+_outbox = cast("Table", OutboxEventModel.__table__)
+
+# Write statements for save and save_with_outbox. Bind names are prefixed per
+# table so the three statements can share one parameter dict when combined.
+_upsert_payment = pg_insert(_payments).values(
+    {c.name: bindparam(f"p_{c.name}", type_=c.type) for c in _payments.c}
+)
+_UPSERT_PAYMENT = _upsert_payment.on_conflict_do_update(
+    index_elements=[_payments.c.id],
+    set_={
+        c.name: _upsert_payment.excluded[c.name]
+        for c in _payments.c
+        if c.name not in {"id", "created_at"}
+    },
+)
+_INSERT_TRANSACTION = insert(_transactions).values(
+    {c.name: bindparam(f"t_{c.name}", type_=c.type) for c in _transactions.c}
+)
+_INSERT_OUTBOX_EVENT = insert(_outbox).values(
+    {
+        c.name: bindparam(f"e_{c.name}", type_=c.type)
+        for c in _outbox.c
+        if c.name not in {"created_at", "published_at", "last_error"}
+    }
+)
+# Data-modifying CTEs always run to completion, so one statement writes
+# every row in a single round trip.
+_SAVE_WITH_OUTBOX = _INSERT_OUTBOX_EVENT.add_cte(_UPSERT_PAYMENT.cte("p"))
+_SAVE_WITH_TRANSACTION_AND_OUTBOX = _INSERT_OUTBOX_EVENT.add_cte(
+    _UPSERT_PAYMENT.cte("p"), _INSERT_TRANSACTION.cte("t")
+)
 
 
 class PostgreSQLPaymentRepository:
@@ -28,85 +104,140 @@ class PostgreSQLPaymentRepository:
         self._session = session
 
     async def save(self, payment: Payment) -> None:
-        """Save or update a payment."""
-        model = await self._session.get(PaymentModel, payment.id)
-
-        if model:
-            # Update existing
-            model.customer_id = payment.customer_id
-            model.amount_value = payment.amount.value
-            model.amount_currency = payment.amount.currency
-            model.payment_method = payment.payment_method.value
-            model.provider = payment.provider
-            model.status = payment.status.value
-            model.provider_transaction_id = payment.provider_transaction_id
-            model.refunded_amount_value = (
-                payment.refunded_amount.value if payment.refunded_amount else Decimal("0.00")
-            )
-            model.refunded_amount_currency = payment.amount.currency
-            model.updated_at = payment.updated_at
-            model.payment_metadata = payment.metadata
+        """Save or update a payment with a single ``INSERT ... ON CONFLICT``.
+
+        Only flushes; the unit of work owning the session commits.
+        """
+        await self._session.execute(_UPSERT_PAYMENT, self._payment_params(payment))
+
+    async def save_with_outbox(
+        self,
+        payment: Payment,
+        event: OutboxEvent,
+        transaction: Transaction | None = None,
+    ) -> None:
+        """Save a payment, an optional new transaction and an outbox event atomically.
+
+        Issued as one CTE statement; with ``ENABLE_SINGLE_STATEMENT_WRITES``
+        off the same statements run one after another in the same transaction.
+
+        Unlike ``save`` this commits: it is the durability point of the payment
+        flow, and committing releases the connection to the pool while the
+        caller waits on the payment provider.
+        """
+        params = self._payment_params(payment) | self._event_params(event)
+        if transaction:
+            params |= self._transaction_params(transaction)
+
+        if FeatureFlags.ENABLE_SINGLE_STATEMENT_WRITES:
+            stmt = _SAVE_WITH_TRANSACTION_AND_OUTBOX if transaction else _SAVE_WITH_OUTBOX
+            await self._session.execute(stmt, params)
         else:
-            # Create new
-            model = PaymentModel(
-                id=payment.id,
-                customer_id=payment.customer_id,
-                amount_value=payment.amount.value,
-                amount_currency=payment.amount.currency,
-                payment_method=payment.payment_method.value,
-                provider=payment.provider,
-                status=payment.status.value,
-                provider_transaction_id=payment.provider_transaction_id,
-                refunded_amount_value=(
-                    payment.refunded_amount.value if payment.refunded_amount else Decimal("0.00")
-                ),
-                refunded_amount_currency=payment.amount.currency,
-                created_at=payment.created_at,
-                updated_at=payment.updated_at,
-                payment_metadata=payment.metadata,
-            )
-            self._session.add(model)
+            await self._session.execute(_UPSERT_PAYMENT, params)
+            if transaction:
+                await self._session.execute(_INSERT_TRANSACTION, params)
+            await self._session.execute(_INSERT_OUTBOX_EVENT, params)
 
         await self._session.commit()
-        await self._session.refresh(model)
 
     async def get_by_id(self, payment_id: str) -> Payment | None:
         """Get payment by ID."""
-        model = await self._session.get(PaymentModel, payment_id)
-        if not model:
+        result = await self._session.execute(_SELECT_BY_ID, {"payment_id": payment_id})
+        row = result.one_or_none()
+        if not row:
             return None
-        return self._model_to_entity(model)
+        return self._row_to_entity(row)
 
     async def get_by_customer_id(self, customer_id: str) -> list[Payment]:
         """Get all payments for a customer."""
-        result = await self._session.execute(
-            select(PaymentModel).where(PaymentModel.customer_id == customer_id)
-        )
-        models = result.scalars().all()
-        return [self._model_to_entity(m) for m in models]
+        result = await self._session.execute(_SELECT_BY_CUSTOMER, {"customer_id": customer_id})
+        return [self._row_to_entity(row) for row in result]
 
     async def delete(self, payment_id: str) -> None:
-        """Delete a payment."""
-        model = await self._session.get(PaymentModel, payment_id)
-        if model:
-            await self._session.delete(model)
-            await self._session.commit()
-
-    def _model_to_entity(self, model: PaymentModel) -> Payment:
-        """Convert database model to domain entity."""
-        return Payment(
-            id=model.id,
-            customer_id=model.customer_id,
-            amount=Amount(value=model.amount_value, currency=model.amount_currency),
-            payment_method=PaymentMethod(model.payment_method),
-            provider=model.provider,
-            status=TransactionStatus(model.status),
-            provider_transaction_id=model.provider_transaction_id,
-            refunded_amount=Amount(
-                value=model.refunded_amount_value,
-                currency=model.refunded_amount_currency,
+        """Delete a payment (flushed, committed by the unit of work)."""
+        await self._session.execute(_DELETE_BY_ID, {"payment_id": payment_id})
+
+    @staticmethod
+    def _payment_params(payment: Payment) -> dict[str, object]:
+        """Bind parameters for the payment upsert."""
+        return {
+            "p_id": payment.id,
+            "p_customer_id": payment.customer_id,
+            "p_amount_value": payment.amount.value,
+            "p_amount_currency": payment.amount.currency,
+            "p_payment_method": payment.payment_method.value,
+            "p_provider": payment.provider,
+            "p_status": payment.status.value,
+            "p_provider_transaction_id": payment.provider_transaction_id,
+            "p_refunded_amount_value": (
+                payment.refunded_amount.value if payment.refunded_amount else Decimal("0.00")
             ),
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-            metadata=model.payment_metadata,
+            "p_refunded_amount_currency": payment.amount.currency,
+            "p_created_at": payment.created_at,
+            "p_updated_at": payment.updated_at,
+            "p_payment_metadata": payment.metadata,
+        }
+
+    @staticmethod
+    def _transaction_params(transaction: Transaction) -> dict[str, object]:
+        """Bind parameters for the transaction insert."""
+        return {
+            "t_id": transaction.id,
+            "t_payment_id": transaction.payment_id,
+            "t_amount_value": transaction.amount.value,
+            "t_amount_currency": transaction.amount.currency,
+            "t_transaction_type": transaction.transaction_type,
+            "t_status": transaction.status.value,
+            "t_provider": transaction.provider,
+            "t_provider_transaction_id": transaction.provider_transaction_id,
+            "t_error_message": transaction.error_message,
+            "t_created_at": transaction.created_at,
+            "t_transaction_metadata": transaction.metadata,
+        }
+
+    @staticmethod
+    def _event_params(event: OutboxEvent) -> dict[str, object]:
+        """Bind parameters for the outbox event insert."""
+        return {
+            "e_id": event.id,
+            "e_aggregate_type": event.aggregate_type,
+            "e_aggregate_id": event.aggregate_id,
+            "e_event_type": event.event_type,
+            "e_payload": event.payload,
+            "e_attempts": event.attempts,
+        }
+
+    @staticmethod
+    def _row_to_entity(row: Sequence[Any]) -> Payment:
+        """Convert a ``_PAYMENT_COLUMNS`` row to a domain entity.
+
+        Tuple unpacking instead of per-field attribute access on the Row.
+        """
+        (
+            payment_id,
+            customer_id,
+            amount_value,
+            amount_currency,
+            payment_method,
+            provider,
+            status,
+            provider_transaction_id,
+            refunded_amount_value,
+            refunded_amount_currency,
+            created_at,
+            updated_at,
+            metadata,
+        ) = row
+        return Payment(
+            id=payment_id,
+            customer_id=customer_id,
+            amount=Amount(value=amount_value, currency=amount_currency),
+            payment_method=_PAYMENT_METHODS[payment_method],
+            provider=provider,
+            status=_STATUSES[status],
+            provider_transaction_id=provider_transaction_id,
+            refunded_amount=Amount(value=refunded_amount_value, currency=refunded_amount_currency),
+            created_at=created_at,
+            updated_at=updated_at,
+            metadata=metadata,
         )
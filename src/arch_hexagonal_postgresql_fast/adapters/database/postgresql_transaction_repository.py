@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from sqlalchemy import select
+from collections.abc import Sequence
+from typing import Any, cast
+
+from sqlalchemy import Table, bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from arch_hexagonal_postgresql_fast.adapters.database.sqlalchemy_models import (
@@ -16,6 +20,51 @@ from arch_hexagonal_postgresql_fast.domain.value_objects.transaction_status impo
     TransactionStatus,
 )
 
+_transactions = cast("Table", TransactionModel.__table__)
+
+# Plain dict lookup for row hydration, see PostgreSQLPaymentRepository
+_STATUSES = {status.value: status for status in TransactionStatus}
+
+# Core reads with constant SQL text, see PostgreSQLPaymentRepository.
+# Rows are unpacked by position in _row_to_entity, which must follow this order.
+_TRANSACTION_COLUMNS = (
+    _transactions.c.id,
+    _transactions.c.payment_id,
+    _transactions.c.amount_value,
+    _transactions.c.amount_currency,
+    _transactions.c.transaction_type,
+    _transactions.c.status,
+    _transactions.c.provider,
+    _transactions.c.provider_transaction_id,
+    _transactions.c.error_message,
+    _transactions.c.created_at,
+    _transactions.c.transaction_metadata,
+)
+_SELECT_BY_ID = select(*_TRANSACTION_COLUMNS).where(
+    _transactions.c.id == bindparam("transaction_id")
+)
+_SELECT_BY_PAYMENT = (
+    select(*_TRANSACTION_COLUMNS)
+    .where(_transactions.c.payment_id == bindparam("payment_id"))
+    .order_by(_transactions.c.created_at)
+)
+_SELECT_BY_PROVIDER_ID = select(*_TRANSACTION_COLUMNS).where(
+    _transactions.c.provider_transaction_id == bindparam("provider_transaction_id")
+)
+
+# One round trip for insert-or-update; created_at keeps its first value
+_upsert_transaction = pg_insert(_transactions).values(
+    {c.name: bindparam(c.name, type_=c.type) for c in _transactions.c}
+)
+_UPSERT_TRANSACTION = _upsert_transaction.on_conflict_do_update(
+    index_elements=[_transactions.c.id],
+    set_={
+        c.name: _upsert_transaction.excluded[c.name]
+        for c in _transactions.c
+        if c.name not in {"id", "created_at"}
+    },
+)
+
 
 class PostgreSQLTransactionRepository:
     """PostgreSQL implementation of transaction repository."""
@@ -25,82 +74,79 @@ class PostgreSQLTransactionRepository:
         self._session = session
 
     async def save(self, transaction: Transaction) -> None:
-        """Save a transaction."""
-        model = await self._session.get(TransactionModel, transaction.id)
-
-        if model:
-            # Update existing
-            model.payment_id = transaction.payment_id
-            model.amount_value = transaction.amount.value
-            model.amount_currency = transaction.amount.currency
-            model.transaction_type = transaction.transaction_type
-            model.status = transaction.status.value
-            model.provider = transaction.provider
-            model.provider_transaction_id = transaction.provider_transaction_id
-            model.error_message = transaction.error_message
-            model.transaction_metadata = transaction.metadata
-        else:
-            # Create new
-            model = TransactionModel(
-                id=transaction.id,
-                payment_id=transaction.payment_id,
-                amount_value=transaction.amount.value,
-                amount_currency=transaction.amount.currency,
-                transaction_type=transaction.transaction_type,
-                status=transaction.status.value,
-                provider=transaction.provider,
-                provider_transaction_id=transaction.provider_transaction_id,
-                error_message=transaction.error_message,
-                created_at=transaction.created_at,
-                transaction_metadata=transaction.metadata,
-            )
-            self._session.add(model)
-
-        await self._session.commit()
-        await self._session.refresh(model)
+        """Save or update a transaction with a single ``INSERT ... ON CONFLICT``.
+
+        Only flushes; the unit of work owning the session commits.
+        """
+        await self._session.execute(_UPSERT_TRANSACTION, self._transaction_params(transaction))
 
     async def get_by_id(self, transaction_id: str) -> Transaction | None:
         """Get transaction by ID."""
-        model = await self._session.get(TransactionModel, transaction_id)
-        if not model:
+        result = await self._session.execute(_SELECT_BY_ID, {"transaction_id": transaction_id})
+        row = result.one_or_none()
+        if not row:
             return None
-        return self._model_to_entity(model)
+        return self._row_to_entity(row)
 
     async def get_by_payment_id(self, payment_id: str) -> list[Transaction]:
         """Get all transactions for a payment."""
-        result = await self._session.execute(
-            select(TransactionModel)
-            .where(TransactionModel.payment_id == payment_id)
-            .order_by(TransactionModel.created_at)
-        )
-        models = result.scalars().all()
-        return [self._model_to_entity(m) for m in models]
+        result = await self._session.execute(_SELECT_BY_PAYMENT, {"payment_id": payment_id})
+        return [self._row_to_entity(row) for row in result]
 
     async def get_by_provider_transaction_id(
         self, provider_transaction_id: str
     ) -> Transaction | None:
         """Get transaction by provider transaction ID."""
         result = await self._session.execute(
-            select(TransactionModel).where(
-                TransactionModel.provider_transaction_id == provider_transaction_id
-            )
+            _SELECT_BY_PROVIDER_ID, {"provider_transaction_id": provider_transaction_id}
         )
-        model = result.scalar_one_or_none()
-        if not model:
+        row = result.one_or_none()
+        if not row:
             return None
-        return self._model_to_entity(model)
+        return self._row_to_entity(row)
+
+    @staticmethod
+    def _transaction_params(transaction: Transaction) -> dict[str, object]:
+        """Bind parameters for the transaction upsert."""
+        return {
+            "id": transaction.id,
+            "payment_id": transaction.payment_id,
+            "amount_value": transaction.amount.value,
+            "amount_currency": transaction.amount.currency,
+            "transaction_type": transaction.transaction_type,
+            "status": transaction.status.value,
+            "provider": transaction.provider,
+            "provider_transaction_id": transaction.provider_transaction_id,
+            "error_message": transaction.error_message,
+            "created_at": transaction.created_at,
+            "transaction_metadata": transaction.metadata,
+        }
 
-    def _model_to_entity(self, model: TransactionModel) -> Transaction:
-        """Convert database model to domain entity."""
+    @staticmethod
+    def _row_to_entity(row: Sequence[Any]) -> Transaction:
+        """Convert a ``_TRANSACTION_COLUMNS`` row to a domain entity."""
+        (
+            transaction_id,
+            payment_id,
+            amount_value,
+            amount_currency,
+            transaction_type,
+            status,
+            provider,
+            provider_transaction_id,
+            error_message,
+            created_at,
+            metadata,
+        ) = row
         return Transaction(
-            id=model.id,
-            payment_id=model.payment_id,
-            amount=Amount(value=model.amount_value, currency=model.amount_currency),
-            transaction_type=model.transaction_type,
-            status=TransactionStatus(model.status),
-            provider=model.provider,
-            provider_transaction_id=model.provider_transaction_id,
-            error_message=model.error_message,
-            created_at=model.created_at,
-            metadata=model.transaction_metadata,
+            id=transaction_id,
+            payment_id=payment_id,
+            amount=Amount(value=amount_value, currency=amount_currency),
+            transaction_type=transaction_type,
+            status=_STATUSES[status],
+            provider=provider,
+            provider_transaction_id=provider_transaction_id,
+            error_message=error_message,
+            created_at=created_at,
+            metadata=metadata,
         )
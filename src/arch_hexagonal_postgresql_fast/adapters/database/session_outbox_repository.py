@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from arch_hexagonal_postgresql_fast.adapters.database.postgresql_outbox_repository import (
@@ -16,6 +18,11 @@ from arch_hexagonal_postgresql_fast.application.ports.outbox_repository import (
     OutboxRepository,
 )
 
+# Losing the last published_at marks in a crash only means those events are
+# published again, which at-least-once delivery already allows. Not waiting
+# for the WAL flush is worth it for a commit that runs every batch.
+_ASYNC_COMMIT = text("SET LOCAL synchronous_commit = OFF")
+
 
 class SessionManagedOutboxRepository(OutboxRepository):
     """OutboxRepository that creates new sessions for each operation.
@@ -37,11 +44,31 @@ class SessionManagedOutboxRepository(OutboxRepository):
             await repo.save(event)
             await session.commit()
 
-    async def get_unpublished(self, limit: int = 100) -> list[OutboxEvent]:
-        """Get unpublished events using new session."""
+    async def save_many(self, events: list[OutboxEvent]) -> None:
+        """Save outbox events in one batch using new session."""
+        async with await self._get_session() as session:
+            repo = PostgreSQLOutboxRepository(session)
+            await repo.save_many(events)
+            await session.commit()
+
+    async def get_unpublished(self, limit: int = 100, max_attempts: int = 5) -> list[OutboxEvent]:
+        """Get unpublished events using new session.
+
+        The row locks end with the session; use ``transaction()`` to keep a
+        claimed batch leased while it is published.
+        """
+        async with await self._get_session() as session:
+            repo = PostgreSQLOutboxRepository(session)
+            return await repo.get_unpublished(limit, max_attempts)
+
+    async def iter_unpublished(
+        self, limit: int = 100, max_attempts: int = 5
+    ) -> AsyncIterator[OutboxEvent]:
+        """Stream unpublished events; the session stays open until iteration ends."""
         async with await self._get_session() as session:
             repo = PostgreSQLOutboxRepository(session)
-            return await repo.get_unpublished(limit)
+            async for event in repo.iter_unpublished(limit, max_attempts):
+                yield event
 
     async def mark_published(self, event_id: UUID) -> None:
         """Mark event as published using new session."""
@@ -50,6 +77,13 @@ class SessionManagedOutboxRepository(OutboxRepository):
             await repo.mark_published(event_id)
             await session.commit()
 
+    async def mark_published_many(self, event_ids: list[UUID]) -> None:
+        """Mark events as published using new session."""
+        async with await self._get_session() as session:
+            repo = PostgreSQLOutboxRepository(session)
+            await repo.mark_published_many(event_ids)
+            await session.commit()
+
     async def increment_attempts(self, event_id: UUID, error: str) -> None:
         """Increment attempts using new session."""
         async with await self._get_session() as session:
@@ -57,12 +91,45 @@ class SessionManagedOutboxRepository(OutboxRepository):
             await repo.increment_attempts(event_id, error)
             await session.commit()
 
+    async def increment_attempts_many(self, failures: list[tuple[UUID, str]]) -> None:
+        """Increment attempts for several events using new session."""
+        async with await self._get_session() as session:
+            repo = PostgreSQLOutboxRepository(session)
+            await repo.increment_attempts_many(failures)
+            await session.commit()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[OutboxRepository]:
+        """Run the enclosed operations on one session, committed once on exit.
+
+        One checkout and one BEGIN/COMMIT per batch instead of one per call;
+        an exception rolls the whole scope back. The commit does not wait for
+        the WAL flush (see ``_ASYNC_COMMIT``).
+        """
+        async with await self._get_session() as session:
+            await session.execute(_ASYNC_COMMIT)
+            yield PostgreSQLOutboxRepository(session)
+            await session.commit()
+
     async def get_failed(self, max_attempts: int = 5) -> list[OutboxEvent]:
         """Get failed events using new session."""
         async with await self._get_session() as session:
             repo = PostgreSQLOutboxRepository(session)
             return await repo.get_failed(max_attempts)
 
+    async def iter_failed(self, max_attempts: int = 5) -> AsyncIterator[OutboxEvent]:
+        """Stream failed events; the session stays open until iteration ends."""
+        async with await self._get_session() as session:
+            repo = PostgreSQLOutboxRepository(session)
+            async for event in repo.iter_failed(max_attempts):
+                yield event
+
+    async def count_failed(self, max_attempts: int = 5) -> int:
+        """Count failed events using new session."""
+        async with await self._get_session() as session:
+            repo = PostgreSQLOutboxRepository(session)
+            return await repo.count_failed(max_attempts)
+
     async def _get_session(self) -> AsyncSession:
         """Get new session from factory."""
         return await self._session_factory()
@@ -5,7 +5,8 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import JSON, DateTime, Numeric, String
+from sqlalchemy import DateTime, Numeric, String, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -30,9 +31,11 @@ class PaymentModel(Base):
     )
     refunded_amount_value: Mapped[Decimal] = mapped_column(Numeric(10, 2), default=Decimal("0.00"))
     refunded_amount_currency: Mapped[str] = mapped_column(String(3))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
-    payment_metadata: Mapped[dict[str, str]] = mapped_column(JSON, default=dict)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    payment_metadata: Mapped[dict[str, str]] = mapped_column(JSONB, default=dict)
 
 
 class TransactionModel(Base):
@@ -51,8 +54,10 @@ class TransactionModel(Base):
         String(255), nullable=True, index=True
     )
     error_message: Mapped[str | None] = mapped_column(String(1000), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
-    transaction_metadata: Mapped[dict[str, str]] = mapped_column(JSON, default=dict)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
+    transaction_metadata: Mapped[dict[str, str]] = mapped_column(JSONB, default=dict)
 
 
 class CustomerModel(Base):
@@ -63,5 +68,5 @@ class CustomerModel(Base):
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     name: Mapped[str] = mapped_column(String(255))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
-    customer_metadata: Mapped[dict[str, str]] = mapped_column(JSON, default=dict)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    customer_metadata: Mapped[dict[str, str]] = mapped_column(JSONB, default=dict)
@@ -0,0 +1,43 @@
+"""SQLAlchemy unit of work implementation."""
+
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from arch_hexagonal_postgresql_fast.adapters.database.postgresql_outbox_repository import (
+    PostgreSQLOutboxRepository,
+)
+from arch_hexagonal_postgresql_fast.adapters.database.postgresql_payment_repository import (
+    PostgreSQLPaymentRepository,
+)
+from arch_hexagonal_postgresql_fast.adapters.database.postgresql_transaction_repository import (
+    PostgreSQLTransactionRepository,
+)
+from arch_hexagonal_postgresql_fast.application.ports.outbox_repository import (
+    OutboxRepository,
+)
+from arch_hexagonal_postgresql_fast.application.ports.payment_repository import (
+    PaymentRepository,
+)
+from arch_hexagonal_postgresql_fast.application.ports.transaction_repository import (
+    TransactionRepository,
+)
+
+
+class SQLAlchemyUnitOfWork:
+    """Payment, transaction and outbox repositories bound to one session."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repositories over the given session."""
+        self._session = session
+        self.payments: PaymentRepository = PostgreSQLPaymentRepository(session)
+        self.transactions: TransactionRepository = PostgreSQLTransactionRepository(session)
+        self.outbox: OutboxRepository = PostgreSQLOutboxRepository(session)
+
+    async def commit(self) -> None:
+        """Commit the session's transaction."""
+        await self._session.commit()
+
+    async def rollback(self) -> None:
+        """Roll back the session's transaction."""
+        await self._session.rollback()
@@ -0,0 +1,89 @@
+"""In-process cache in front of an idempotency store."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from arch_hexagonal_postgresql_fast.application.ports.idempotency_store import (
+        IdempotencyStore,
+    )
+
+
+class CachingIdempotencyStore:
+    """Idempotency store with a bounded, expiring LRU of recent results.
+
+    Retries of a command usually reach the same process shortly after the
+    first attempt stored its result, so a local hit saves the Redis round
+    trip. Only stored results are cached, never misses: a key without a
+    result must always be looked up in the backing store. Writes go through
+    to the backing store first, and a written result is cached no longer
+    than the ``ttl`` it was written with, so it never outlives its key in
+    the backing store.
+
+    Another process may overwrite or delete a key this one has cached; the
+    entry then stays stale for at most ``ttl`` seconds. Results are written
+    once per key (``claim``), so in practice that only affects ``delete``.
+    """
+
+    def __init__(self, store: IdempotencyStore, maxsize: int = 10_000, ttl: float = 300.0) -> None:
+        """Initialize cache in front of store.
+
+        Args:
+            store: Backing idempotency store
+            maxsize: Maximum number of cached results
+            ttl: Seconds a cached result is served without asking the store
+        """
+        self._store = store
+        self._maxsize = maxsize
+        self._ttl = ttl
+        # key -> (monotonic expiry, result); least recently used first
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    async def get_result(self, key: str) -> dict[str, Any] | None:
+        """Get cached result, asking the backing store on a local miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, cached = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                # Callers may modify the dict they get back
+                return dict(cached)
+            del self._entries[key]
+
+        result = await self._store.get_result(key)
+        if result is not None:
+            self._remember(key, result, self._ttl)
+        return result
+
+    async def store_result(self, key: str, result: dict[str, Any], ttl: int = 86400) -> None:
+        """Store result in the backing store, then cache it."""
+        await self._store.store_result(key, result, ttl)
+        self._remember(key, result, ttl)
+
+    async def claim(self, key: str, result: dict[str, Any], ttl: int = 86400) -> bool:
+        """Claim key in the backing store; cache the result only if this call won."""
+        claimed = await self._store.claim(key, result, ttl)
+        if claimed:
+            self._remember(key, result, ttl)
+        return claimed
+
+    async def store_many(self, results: dict[str, dict[str, Any]], ttl: int = 86400) -> None:
+        """Store results in the backing store, then cache them."""
+        await self._store.store_many(results, ttl)
+        for key, result in results.items():
+            self._remember(key, result, ttl)
+
+    async def delete(self, key: str) -> None:
+        """Delete key from the backing store and the cache."""
+        self._entries.pop(key, None)
+        await self._store.delete(key)
+
+    def _remember(self, key: str, result: dict[str, Any], ttl: float) -> None:
+        """Cache a copy of result for at most ttl seconds, evicting the LRU entry if full."""
+        self._entries[key] = (time.monotonic() + min(self._ttl, ttl), dict(result))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
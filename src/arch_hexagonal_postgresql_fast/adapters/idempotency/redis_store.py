@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+import msgspec
 import redis.asyncio as redis
 
+# MessagePack: binary, more compact than JSON and stored as raw bytes
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(dict[str, Any])
+# Entries written before the switch are JSON objects and still within TTL
+_legacy_decoder = msgspec.json.Decoder(dict[str, Any])
+
 
 class RedisIdempotencyStore:
     """Redis implementation of idempotency store."""
@@ -25,24 +31,18 @@ class RedisIdempotencyStore:
         if self._redis:
             await self._redis.close()
 
-    async def is_duplicate(self, key: str) -> bool:
-        """Check if key has been used before."""
-        if not self._redis:
-            raise RuntimeError("Not connected to Redis")
-
-        exists = await self._redis.exists(self._get_key(key))
-        return bool(exists)
-
     async def get_result(self, key: str) -> dict[str, Any] | None:
         """Get cached result for idempotency key."""
         if not self._redis:
             raise RuntimeError("Not connected to Redis")
 
         data = await self._redis.get(self._get_key(key))
-        if data:
-            result: dict[str, Any] = json.loads(data)
-            return result
-        return None
+        if not data:
+            return None
+        # A msgpack map never starts with "{", a JSON object always does
+        if isinstance(data, str) or data[:1] == b"{":
+            return _legacy_decoder.decode(data)
+        return _decoder.decode(data)
 
     async def store_result(self, key: str, result: dict[str, Any], ttl: int = 86400) -> None:
         """Store result for idempotency key."""
@@ -52,8 +52,34 @@ class RedisIdempotencyStore:
         await self._redis.setex(
             self._get_key(key),
             ttl,
-            json.dumps(result),
+            _encoder.encode(result),
+        )
+
+    async def claim(self, key: str, result: dict[str, Any], ttl: int = 86400) -> bool:
+        """Store result only if the key is unused, in a single SET NX EX."""
+        if not self._redis:
+            raise RuntimeError("Not connected to Redis")
+
+        claimed = await self._redis.set(
+            self._get_key(key),
+            _encoder.encode(result),
+            ex=ttl,
+            nx=True,
         )
+        return bool(claimed)
+
+    async def store_many(self, results: dict[str, dict[str, Any]], ttl: int = 86400) -> None:
+        """Store results for several idempotency keys in one pipelined round trip."""
+        if not self._redis:
+            raise RuntimeError("Not connected to Redis")
+        if not results:
+            return
+
+        # transaction=False: plain pipelining, no MULTI/EXEC around the writes
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, result in results.items():
+                pipe.setex(self._get_key(key), ttl, _encoder.encode(result))
+            await pipe.execute()
 
     async def delete(self, key: str) -> None:
         """Delete idempotency key."""
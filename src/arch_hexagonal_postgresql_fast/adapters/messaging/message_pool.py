@@ -0,0 +1,47 @@
+"""Reusable aio_pika Message wrappers for messages with constant properties."""
+
+from __future__ import annotations
+
+from collections import deque
+
+from aio_pika import DeliveryMode, Message
+
+
+class MessagePool:
+    """Pool of Message wrappers whose only varying part is the body.
+
+    Constructing a Message validates and converts every property and costs
+    far more than encoding the body; the properties here never change, so a
+    wrapper is built once and only its body is swapped. A wrapper can be
+    released once publish() has returned, as aio_pika only reads it while
+    sending.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        delivery_mode: DeliveryMode = DeliveryMode.PERSISTENT,
+        content_type: str = "application/json",
+    ) -> None:
+        """Initialize pool keeping at most size idle wrappers."""
+        self._idle: deque[Message] = deque(maxlen=size)
+        self._delivery_mode = delivery_mode
+        self._content_type = content_type
+
+    def acquire(self, body: bytes) -> Message:
+        """Take an idle wrapper, or build one, and set its body."""
+        try:
+            message = self._idle.pop()
+        except IndexError:
+            message = Message(
+                body=b"",
+                content_type=self._content_type,
+                delivery_mode=self._delivery_mode,
+            )
+        message.body = body
+        message.body_size = len(body)
+        return message
+
+    def release(self, message: Message) -> None:
+        """Return a wrapper whose publish has completed."""
+        self._idle.append(message)
@@ -19,9 +19,18 @@ logger = logging.getLogger(__name__)
 class RabbitMQCommandConsumer:
     """RabbitMQ implementation of command consumer."""
 
-    def __init__(self, rabbitmq_url: str) -> None:
-        """Initialize consumer with RabbitMQ connection URL."""
+    def __init__(self, rabbitmq_url: str, prefetch_count: int = 32) -> None:
+        """Initialize consumer with RabbitMQ connection URL.
+
+        Args:
+            rabbitmq_url: RabbitMQ connection URL
+            prefetch_count: Unacked messages the broker may deliver at once.
+                aio_pika runs the callback per delivery, so this also bounds
+                how many commands are handled concurrently.
+
+        """
         self._url = rabbitmq_url
+        self._prefetch_count = prefetch_count
         self._connection: AbstractConnection | None = None
         self._channel: AbstractChannel | None = None
         self._queue: AbstractQueue | None = None
@@ -30,9 +39,9 @@ class RabbitMQCommandConsumer:
         """Establish connection to RabbitMQ."""
         self._connection = await connect_robust(self._url)
         self._channel = await self._connection.channel()
-        # Set prefetch count for fair distribution
+        # Bounded prefetch: overlaps handlers without starving other consumers
         if self._channel:
-            await self._channel.set_qos(prefetch_count=1)
+            await self._channel.set_qos(prefetch_count=self._prefetch_count)
         logger.info("RabbitMQ command consumer connected")
 
     async def disconnect(self) -> None:
@@ -0,0 +1,44 @@
+"""Shared RabbitMQ connection for publishers in one process."""
+
+from __future__ import annotations
+
+import logging
+
+from aio_pika import connect_robust
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+
+logger = logging.getLogger(__name__)
+
+
+class RabbitMQConnectionManager:
+    """Owns one robust AMQP connection that several publishers open channels on.
+
+    One TCP connection with a channel per publisher saves a socket, a
+    handshake and a heartbeat stream per publisher. Consumers should keep
+    their own connection: when the broker applies flow control to a
+    publishing connection, it blocks consumers on that connection as well.
+    """
+
+    def __init__(self, rabbitmq_url: str) -> None:
+        """Initialize manager with RabbitMQ connection URL."""
+        self._url = rabbitmq_url
+        self._connection: AbstractRobustConnection | None = None
+
+    async def connect(self) -> None:
+        """Open the shared connection."""
+        self._connection = await connect_robust(self._url)
+        logger.info("RabbitMQ shared connection opened")
+
+    async def close(self) -> None:
+        """Close the shared connection, and with it every channel opened on it."""
+        if self._connection:
+            await self._connection.close()
+            self._connection = None
+        logger.info("RabbitMQ shared connection closed")
+
+    async def channel(self, *, publisher_confirms: bool = True) -> AbstractChannel:
+        """Open a new channel on the shared connection."""
+        if not self._connection:
+            msg = "Not connected to RabbitMQ"
+            raise RuntimeError(msg)
+        return await self._connection.channel(publisher_confirms=publisher_confirms)
@@ -2,30 +2,126 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+import logging
+import time
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 import aio_pika
+import msgspec
 
 from arch_hexagonal_postgresql_fast.domain.entities.payment import Payment
+from arch_hexagonal_postgresql_fast.domain.value_objects.amount import Amount
+
+from .message_pool import MessagePool
+
+if TYPE_CHECKING:
+    from .rabbitmq_connection import RabbitMQConnectionManager
+
+logger = logging.getLogger(__name__)
+
+
+class EventEnvelope(msgspec.Struct, frozen=True):
+    """Wire format of an event message.
+
+    ``timestamp`` is formatted by msgspec's encoder (RFC 3339, ``Z`` suffix)
+    rather than by ``datetime.isoformat()``, which cost more than encoding
+    the rest of the envelope.
+    """
+
+    event_type: str
+    timestamp: datetime
+    data: dict[str, object]
+
+
+# enc_hook=str keeps the json.dumps(..., default=str) behaviour for payload
+# values msgspec cannot encode natively.
+_envelope_encoder = msgspec.json.Encoder(enc_hook=str)
+
+# Idle Message wrappers kept per publisher; enough for a full outbox batch
+_MESSAGE_POOL_SIZE = 128
+
+# Fire-and-forget mode: messages the writer task sends per gather, and how
+# many may wait for it before publishers block
+_WRITE_BATCH_SIZE = 64
+_WRITE_QUEUE_SIZE = 10_000
+
+# How long one envelope timestamp is reused across publishes
+_TIMESTAMP_TTL_NS = 1_000_000
 
 
 class RabbitMQEventPublisher:
-    """RabbitMQ implementation of event publisher."""
+    """RabbitMQ implementation of event publisher.
+
+    With publisher confirms (the default) ``publish_event`` returns only once
+    the broker has taken the message; the outbox relies on this before marking
+    an event published. Without them a publish is fire-and-forget: no broker
+    round trip, but a message lost in flight is lost for good (at-most-once).
+    In that mode ``publish_event`` only queues the encoded message; a single
+    writer task drains the queue in batches, and ``flush()`` waits for it.
+    Messages are also sent non-persistent then: with no confirm there is no
+    delivery guarantee for the broker's fsync to protect.
+
+    Given a ``connection_manager``, the publisher opens its channel on that
+    shared connection and leaves closing the connection to its owner.
+    """
 
-    def __init__(self, connection_url: str) -> None:
+    def __init__(
+        self,
+        connection_url: str,
+        publisher_confirms: bool = True,
+        connection_manager: RabbitMQConnectionManager | None = None,
+    ) -> None:
         """Initialize publisher with connection URL."""
         self._connection_url = connection_url
+        self._publisher_confirms = publisher_confirms
+        self._connection_manager = connection_manager
         self._connection: aio_pika.abc.AbstractRobustConnection | None = None
         self._channel: aio_pika.abc.AbstractChannel | None = None
+        self._message_pool = MessagePool(
+            _MESSAGE_POOL_SIZE,
+            delivery_mode=(
+                aio_pika.DeliveryMode.PERSISTENT
+                if publisher_confirms
+                else aio_pika.DeliveryMode.NOT_PERSISTENT
+            ),
+        )
+        self._write_queue: asyncio.Queue[tuple[bytes, str]] | None = None
+        self._writer: asyncio.Task[None] | None = None
+        self._timestamp = datetime.now(UTC)
+        self._timestamp_taken_ns = time.monotonic_ns()
 
     async def connect(self) -> None:
         """Connect to RabbitMQ."""
-        self._connection = await aio_pika.connect_robust(self._connection_url)
-        self._channel = await self._connection.channel()
+        if self._connection_manager:
+            self._channel = await self._connection_manager.channel(
+                publisher_confirms=self._publisher_confirms,
+            )
+        else:
+            self._connection = await aio_pika.connect_robust(self._connection_url)
+            self._channel = await self._connection.channel(
+                publisher_confirms=self._publisher_confirms,
+            )
+        if not self._publisher_confirms:
+            self._write_queue = asyncio.Queue(maxsize=_WRITE_QUEUE_SIZE)
+            self._writer = asyncio.create_task(self._drain_writes(self._write_queue))
+
+    async def flush(self) -> None:
+        """Wait until every queued fire-and-forget message has been sent."""
+        if self._write_queue:
+            await self._write_queue.join()
 
     async def disconnect(self) -> None:
-        """Disconnect from RabbitMQ."""
+        """Disconnect from RabbitMQ, sending queued messages first."""
+        if self._writer:
+            await self.flush()
+            self._writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer
+            self._writer = None
+            self._write_queue = None
         if self._channel:
             await self._channel.close()
         if self._connection:
@@ -54,7 +150,8 @@ class RabbitMQEventPublisher:
             {
                 "payment_id": payment.id,
                 "customer_id": payment.customer_id,
-                "amount": str(payment.amount),
+                "amount_cents": payment.amount.to_cents(),
+                "currency": payment.amount.currency,
                 "status": payment.status.value,
             },
         )
@@ -66,7 +163,8 @@ class RabbitMQEventPublisher:
             {
                 "payment_id": payment.id,
                 "customer_id": payment.customer_id,
-                "amount": str(payment.amount),
+                "amount_cents": payment.amount.to_cents(),
+                "currency": payment.amount.currency,
                 "provider_transaction_id": payment.provider_transaction_id,
             },
         )
@@ -78,20 +176,22 @@ class RabbitMQEventPublisher:
             {
                 "payment_id": payment.id,
                 "customer_id": payment.customer_id,
-                "amount": str(payment.amount),
+                "amount_cents": payment.amount.to_cents(),
+                "currency": payment.amount.currency,
                 "error": error,
             },
         )
 
-    async def publish_payment_refunded(self, payment: Payment, refund_amount: str) -> None:
+    async def publish_payment_refunded(self, payment: Payment, refund_amount: Amount) -> None:
         """Publish payment refunded event."""
         await self._publish_event(
             "payment.refunded",
             {
                 "payment_id": payment.id,
                 "customer_id": payment.customer_id,
-                "original_amount": str(payment.amount),
-                "refund_amount": refund_amount,
+                "original_amount_cents": payment.amount.to_cents(),
+                "currency": payment.amount.currency,
+                "refund_amount_cents": refund_amount.to_cents(),
                 "status": payment.status.value,
             },
         )
@@ -113,16 +213,65 @@ class RabbitMQEventPublisher:
         if not self._channel:
             raise RuntimeError("Not connected to RabbitMQ")
 
-        event = {
-            "event_type": event_type,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "data": data,
-        }
-
-        message = aio_pika.Message(
-            body=json.dumps(event, default=str).encode(),
-            content_type="application/json",
-            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        event = EventEnvelope(
+            event_type=event_type,
+            timestamp=self._now(),
+            data=data,
         )
 
-        await self._channel.default_exchange.publish(message, routing_key=routing_key)
+        body = _envelope_encoder.encode(event)
+        if self._write_queue:
+            await self._write_queue.put((body, routing_key))
+            return
+        await self._send(self._channel, body, routing_key)
+
+    async def _send(
+        self,
+        channel: aio_pika.abc.AbstractChannel,
+        body: bytes,
+        routing_key: str,
+    ) -> None:
+        """Publish one encoded envelope on the default exchange."""
+        message = self._message_pool.acquire(body)
+        try:
+            await channel.default_exchange.publish(message, routing_key=routing_key)
+        finally:
+            self._message_pool.release(message)
+
+    async def _drain_writes(self, queue: asyncio.Queue[tuple[bytes, str]]) -> None:
+        """Send queued messages, taking whatever has piled up as one batch.
+
+        No batching timer: messages queued while a batch is being written
+        form the next batch, so batches grow with load and a lone message
+        is sent at once.
+        """
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _WRITE_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                if self._channel:
+                    channel = self._channel
+                    results = await asyncio.gather(
+                        *(self._send(channel, body, routing_key) for body, routing_key in batch),
+                        return_exceptions=True,
+                    )
+                    for result in results:
+                        if isinstance(result, Exception):
+                            logger.warning("Failed to publish event: %s", result)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _now(self) -> datetime:
+        """Return the envelope timestamp, refreshed at most once per millisecond.
+
+        ``datetime.now(UTC)`` costs several times a monotonic clock read; a
+        burst of publishes (an outbox batch) shares one value instead, so a
+        timestamp may trail the actual publish by up to a millisecond.
+        """
+        now_ns = time.monotonic_ns()
+        if now_ns - self._timestamp_taken_ns >= _TIMESTAMP_TTL_NS:
+            self._timestamp = datetime.now(UTC)
+            self._timestamp_taken_ns = now_ns
+        return self._timestamp
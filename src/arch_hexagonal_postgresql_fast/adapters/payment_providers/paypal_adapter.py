@@ -2,31 +2,60 @@
 
 from __future__ import annotations
 
-from paypalrestsdk import Payment as PayPalPayment
-from paypalrestsdk import Refund as PayPalRefund
-from paypalrestsdk import configure
+import asyncio
+import time
+from typing import Any
+
+import httpx
 
 from arch_hexagonal_postgresql_fast.adapters.payment_providers.exceptions import (
     InvalidPaymentMethodError,
     PaymentProviderError,
+    ProviderConnectionError,
 )
 from arch_hexagonal_postgresql_fast.domain.value_objects.amount import Amount
 
+_BASE_URLS = {
+    "sandbox": "https://api-m.sandbox.paypal.com",
+    "live": "https://api-m.paypal.com",
+}
+
+# Renew the OAuth token this long before PayPal expires it
+_TOKEN_EXPIRY_MARGIN_SECONDS = 60.0
+
 
 class PayPalAdapter:
-    """PayPal payment provider implementation."""
+    """PayPal payment provider implementation.
+
+    Talks to the PayPal REST API over one long-lived httpx client instead of
+    the blocking SDK, so calls neither block the event loop nor queue for a
+    worker thread. The OAuth access token is cached until shortly before it
+    expires.
+    """
 
-    def __init__(self, client_id: str, client_secret: str, mode: str = "sandbox") -> None:
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        mode: str = "sandbox",
+        timeout: float = 10.0,
+        connect_timeout: float = 3.0,
+    ) -> None:
         """Initialize PayPal adapter with credentials."""
-        configure(
-            {
-                "mode": mode,  # sandbox or live
-                "client_id": client_id,
-                "client_secret": client_secret,
-            }
+        self._client = httpx.AsyncClient(
+            base_url=_BASE_URLS[mode],  # sandbox or live
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
         )
+        self._auth = httpx.BasicAuth(client_id, client_secret)
+        self._access_token: str | None = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
         self._name = "paypal"
 
+    async def close(self) -> None:
+        """Close pooled HTTP connections."""
+        await self._client.aclose()
+
     @property
     def name(self) -> str:
         """Provider name."""
@@ -42,8 +71,10 @@ class PayPalAdapter:
     ) -> str:
         """Charge a payment method via PayPal."""
         try:
-            payment = PayPalPayment(
-                {
+            payment = await self._request(
+                "POST",
+                "/v1/payments/payment",
+                json={
                     "intent": "sale",
                     "payer": {"payment_method": "paypal"},
                     "redirect_urls": {
@@ -60,13 +91,13 @@ class PayPalAdapter:
                             "custom": idempotency_key,
                         }
                     ],
-                }
+                },
+                # PayPal deduplicates retried requests carrying the same id
+                headers={"PayPal-Request-Id": idempotency_key},
             )
-
-            if payment.create():
-                return str(payment.id)
-            raise PaymentProviderError(f"PayPal payment creation failed: {payment.error}")
-
+            return str(payment["id"])
+        except PaymentProviderError:
+            raise
         except Exception as e:
             raise PaymentProviderError(f"PayPal charge failed: {e}") from e
 
@@ -78,53 +109,104 @@ class PayPalAdapter:
     ) -> str:
         """Refund a charge via PayPal."""
         try:
-            # Get the sale transaction
-            payment = PayPalPayment.find(provider_transaction_id)
-
-            if not payment:
-                raise InvalidPaymentMethodError(f"Payment {provider_transaction_id} not found")
-
-            # Get the first sale from transactions
-            sale = None
-            for transaction in payment.transactions:
-                related_resources = transaction.get("related_resources", [])
-                for resource in related_resources:
-                    if "sale" in resource:
-                        sale = resource["sale"]
-                        break
+            payment = await self._find_payment(provider_transaction_id)
+
+            # Get the first sale from transactions, stopping at the first match
+            sale = next(
+                (
+                    resource["sale"]
+                    for transaction in payment.get("transactions", ())
+                    for resource in transaction.get("related_resources", ())
+                    if "sale" in resource
+                ),
+                None,
+            )
 
             if not sale:
                 raise InvalidPaymentMethodError("No sale found in payment")
 
-            # Create refund
-            refund_data = {}
+            refund_data: dict[str, Any] = {}
             if amount:
                 refund_data["amount"] = {
                     "total": str(amount.value),
                     "currency": amount.currency,
                 }
+            headers = {"PayPal-Request-Id": idempotency_key} if idempotency_key else None
 
-            _ = PayPalRefund(refund_data)  # Validate refund data
-
-            # Note: This is simplified - actual PayPal refund requires sale ID
-            return f"refund_{provider_transaction_id}"
-
+            refund = await self._request(
+                "POST",
+                f"/v1/payments/sale/{sale['id']}/refund",
+                json=refund_data,
+                headers=headers,
+            )
+            return str(refund["id"])
+        except PaymentProviderError:
+            raise
         except Exception as e:
             raise PaymentProviderError(f"PayPal refund failed: {e}") from e
 
     async def get_charge_status(self, provider_transaction_id: str) -> dict[str, str]:
         """Get charge status from PayPal."""
         try:
-            payment = PayPalPayment.find(provider_transaction_id)
-
-            if not payment:
-                raise InvalidPaymentMethodError(f"Payment {provider_transaction_id} not found")
-
+            payment = await self._find_payment(provider_transaction_id)
             return {
-                "id": payment.id,
-                "status": payment.state,
-                "intent": payment.intent,
+                "id": payment["id"],
+                "status": payment["state"],
+                "intent": payment["intent"],
             }
-
+        except PaymentProviderError:
+            raise
         except Exception as e:
             raise PaymentProviderError(f"PayPal status check failed: {e}") from e
+
+    async def _find_payment(self, payment_id: str) -> dict[str, Any]:
+        """Fetch a payment, mapping 404 to InvalidPaymentMethodError."""
+        try:
+            return await self._request("GET", f"/v1/payments/payment/{payment_id}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == httpx.codes.NOT_FOUND:
+                raise InvalidPaymentMethodError(f"Payment {payment_id} not found") from e
+            raise
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Send an authenticated REST call and return the decoded JSON body."""
+        token = await self._get_access_token()
+        try:
+            response = await self._client.request(
+                method,
+                path,
+                json=json,
+                headers={"Authorization": f"Bearer {token}", **(headers or {})},
+            )
+        except httpx.TransportError as e:
+            raise ProviderConnectionError(str(e)) from e
+        response.raise_for_status()
+        result: dict[str, Any] = response.json()
+        return result
+
+    async def _get_access_token(self) -> str:
+        """Return a cached OAuth token, fetching a new one when it is near expiry."""
+        async with self._token_lock:
+            if self._access_token and time.monotonic() < self._token_expires_at:
+                return self._access_token
+            try:
+                response = await self._client.post(
+                    "/v1/oauth2/token",
+                    data={"grant_type": "client_credentials"},
+                    auth=self._auth,
+                )
+            except httpx.TransportError as e:
+                raise ProviderConnectionError(str(e)) from e
+            response.raise_for_status()
+            token = response.json()
+            self._access_token = str(token["access_token"])
+            self._token_expires_at = (
+                time.monotonic() + float(token["expires_in"]) - _TOKEN_EXPIRY_MARGIN_SECONDS
+            )
+            return self._access_token
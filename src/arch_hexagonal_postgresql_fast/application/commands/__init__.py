@@ -7,7 +7,7 @@ from datetime import datetime
 from decimal import Decimal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Command:
     """Base command with common fields."""
 
@@ -16,7 +16,7 @@ class Command:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProcessPaymentCommand(Command):
     """Command to process a payment."""
 
@@ -28,7 +28,7 @@ class ProcessPaymentCommand(Command):
     metadata: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RefundPaymentCommand(Command):
     """Command to refund a payment."""
 
@@ -2,16 +2,9 @@
 
 from __future__ import annotations
 
-from .strategies import (
-    CompensationStrategy,
-    FraudDetectedCompensation,
-    PaymentFailedCompensation,
-    RetryableFailureCompensation,
-)
+from .strategies import FailureKind, compensate
 
 __all__ = [
-    "CompensationStrategy",
-    "FraudDetectedCompensation",
-    "PaymentFailedCompensation",
-    "RetryableFailureCompensation",
+    "FailureKind",
+    "compensate",
 ]
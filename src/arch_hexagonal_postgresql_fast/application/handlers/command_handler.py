@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import msgspec
 
 from arch_hexagonal_postgresql_fast.application.use_cases.process_payment import (
     ProcessPayment,
@@ -21,16 +24,52 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Publishers send MessagePack; JSON bodies are still accepted so commands
+# queued before the switch are processed
+_MSGPACK_CONTENT_TYPE = "application/msgpack"
+_msgpack_body_decoder = msgspec.msgpack.Decoder(dict[str, Any])
+# Decodes the message body bytes directly, no intermediate str
+_json_body_decoder = msgspec.json.Decoder(dict[str, Any])
+
+
+class ProcessPaymentPayload(msgspec.Struct):
+    """Fields of a ProcessPaymentCommand payload the handler uses.
+
+    ``msgspec.convert`` builds this from the decoded payload in C: the amount
+    string becomes a Decimal and the payment method an enum member from a
+    cached value table, with no per-field str() copies.
+    """
+
+    customer_id: str
+    amount: Decimal
+    currency: str
+    payment_method: PaymentMethod
+    payment_method_token: str
+    idempotency_key: str
+    metadata: dict[str, str] = {}
+
 
 class CommandHandler:
     """Handler for processing commands from message queue."""
 
     def __init__(
         self,
-        process_payment_use_case: ProcessPayment,
+        process_payment_scope: Callable[[], AbstractAsyncContextManager[ProcessPayment]],
     ) -> None:
-        """Initialize command handler with use cases."""
-        self._process_payment = process_payment_use_case
+        """Initialize command handler with use case factories.
+
+        Args:
+            process_payment_scope: Yields a ProcessPayment bound to a fresh
+                database session. Messages are handled concurrently, so each
+                one needs its own session.
+
+        """
+        self._process_payment_scope = process_payment_scope
+        # Command type -> handler, looked up once per message
+        self._dispatch: dict[str, Callable[[dict[str, object]], Awaitable[None]]] = {
+            "ProcessPaymentCommand": self._handle_process_payment,
+            "RefundPaymentCommand": self._handle_refund_payment,
+        }
 
     async def handle_message(self, message: AbstractIncomingMessage) -> None:
         """Handle incoming command message.
@@ -42,29 +81,35 @@ class CommandHandler:
         async with message.process():
             try:
                 # Parse message
-                body = json.loads(message.body.decode())
-                command_type = body.get("command_type")
+                if message.content_type == _MSGPACK_CONTENT_TYPE:
+                    body = _msgpack_body_decoder.decode(message.body)
+                else:
+                    body = _json_body_decoder.decode(message.body)
+                command_type = body.get("command_type", "")
                 payload = body.get("payload", {})
 
-                logger.info(
-                    "Processing command: %s (idempotency_key=%s)",
-                    command_type,
-                    payload.get("idempotency_key"),
-                )
+                # Guarded so the argument lookups are skipped too when the
+                # level is off, not just the formatting
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Processing command: %s (idempotency_key=%s)",
+                        command_type,
+                        payload.get("idempotency_key"),
+                    )
 
                 # Route to appropriate handler
-                if command_type == "ProcessPaymentCommand":
-                    await self._handle_process_payment(payload)
-                elif command_type == "RefundPaymentCommand":
-                    await self._handle_refund_payment(payload)
-                else:
+                handler = self._dispatch.get(command_type)
+                if handler is None:
                     logger.warning("Unknown command type: %s", command_type)
+                    return
+                await handler(payload)
 
-                logger.info(
-                    "Command processed successfully: %s (idempotency_key=%s)",
-                    command_type,
-                    payload.get("idempotency_key"),
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Command processed successfully: %s (idempotency_key=%s)",
+                        command_type,
+                        payload.get("idempotency_key"),
+                    )
 
             except Exception:
                 logger.exception("Error processing command")
@@ -73,19 +118,18 @@ class CommandHandler:
 
     async def _handle_process_payment(self, payload: dict[str, object]) -> None:
         """Handle ProcessPaymentCommand."""
+        command = msgspec.convert(payload, ProcessPaymentPayload)
         request = ProcessPaymentRequest(
-            customer_id=str(payload["customer_id"]),
-            amount=Amount(
-                value=Decimal(str(payload["amount"])),
-                currency=str(payload["currency"]),
-            ),
-            payment_method=PaymentMethod(str(payload["payment_method"])),
-            payment_method_token=str(payload["payment_method_token"]),
-            idempotency_key=str(payload["idempotency_key"]),
-            metadata=payload.get("metadata") or {},  # type: ignore[arg-type]
+            customer_id=command.customer_id,
+            amount=Amount(value=command.amount, currency=command.currency),
+            payment_method=command.payment_method,
+            payment_method_token=command.payment_method_token,
+            idempotency_key=command.idempotency_key,
+            metadata=command.metadata,
         )
 
-        await self._process_payment.execute(request)
+        async with self._process_payment_scope() as process_payment:
+            await process_payment.execute(request)
 
     async def _handle_refund_payment(self, payload: dict[str, object]) -> None:
         """Handle RefundPaymentCommand."""
@@ -8,6 +8,9 @@ from arch_hexagonal_postgresql_fast.application.ports.event_publisher import (
 from arch_hexagonal_postgresql_fast.application.ports.idempotency_store import (
     IdempotencyStore,
 )
+from arch_hexagonal_postgresql_fast.application.ports.outbox_listener import (
+    OutboxListener,
+)
 from arch_hexagonal_postgresql_fast.application.ports.payment_provider import (
     PaymentProvider,
 )
@@ -17,11 +20,14 @@ from arch_hexagonal_postgresql_fast.application.ports.payment_repository import
 from arch_hexagonal_postgresql_fast.application.ports.transaction_repository import (
     TransactionRepository,
 )
+from arch_hexagonal_postgresql_fast.application.ports.unit_of_work import UnitOfWork
 
 __all__ = [
     "EventPublisher",
     "IdempotencyStore",
+    "OutboxListener",
     "PaymentProvider",
     "PaymentRepository",
     "TransactionRepository",
+    "UnitOfWork",
 ]
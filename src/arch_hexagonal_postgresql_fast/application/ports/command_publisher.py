@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
+    from contextlib import AbstractAsyncContextManager
+
     from arch_hexagonal_postgresql_fast.application.commands import (
         ProcessPaymentCommand,
         RefundPaymentCommand,
@@ -26,6 +28,27 @@ class CommandPublisher(Protocol):
         """
         ...
 
+    async def publish_process_payment_batch(
+        self,
+        commands: list[ProcessPaymentCommand],
+    ) -> None:
+        """Publish several process payment commands in one batch.
+
+        Args:
+            commands: ProcessPaymentCommands to publish
+
+        """
+        ...
+
+    def batch(self) -> AbstractAsyncContextManager[None]:
+        """Collect commands published inside the block and send them together on exit.
+
+        Publishes inside the block return immediately; leaving the block
+        publishes everything and waits for the broker to confirm it. Nothing
+        is sent if the block raises.
+        """
+        ...
+
     async def publish_refund_payment(
         self,
         command: RefundPaymentCommand,
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Protocol
 
 from arch_hexagonal_postgresql_fast.domain.entities.payment import Payment
+from arch_hexagonal_postgresql_fast.domain.value_objects.amount import Amount
 
 
 class EventPublisher(Protocol):
@@ -38,6 +39,6 @@ class EventPublisher(Protocol):
         """Publish payment failed event."""
         ...
 
-    async def publish_payment_refunded(self, payment: Payment, refund_amount: str) -> None:
+    async def publish_payment_refunded(self, payment: Payment, refund_amount: Amount) -> None:
         """Publish payment refunded event."""
         ...
@@ -8,10 +8,6 @@ from typing import Any, Protocol
 class IdempotencyStore(Protocol):
     """Interface for idempotency key storage."""
 
-    async def is_duplicate(self, key: str) -> bool:
-        """Check if key has been used before."""
-        ...
-
     async def get_result(self, key: str) -> dict[str, Any] | None:
         """Get cached result for idempotency key."""
         ...
@@ -26,6 +22,31 @@ class IdempotencyStore(Protocol):
         """
         ...
 
+    async def claim(self, key: str, result: dict[str, Any], ttl: int = 86400) -> bool:
+        """Store result only if the key has no result yet.
+
+        Check and write happen atomically, so concurrent callers cannot both
+        win and the first stored result is never overwritten.
+
+        Args:
+            key: Idempotency key
+            result: Result to cache
+            ttl: Time to live in seconds (default 24 hours)
+
+        Returns:
+            True if this call stored the result, False if the key was taken
+        """
+        ...
+
+    async def store_many(self, results: dict[str, dict[str, Any]], ttl: int = 86400) -> None:
+        """Store results for several idempotency keys in one batch.
+
+        Args:
+            results: Results to cache, keyed by idempotency key
+            ttl: Time to live in seconds (default 24 hours)
+        """
+        ...
+
     async def delete(self, key: str) -> None:
         """Delete idempotency key."""
         ...
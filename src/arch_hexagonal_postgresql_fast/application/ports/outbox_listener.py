@@ -0,0 +1,21 @@
+"""Outbox listener port for waking publishers when new events are written."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class OutboxListener(Protocol):
+    """Port for waiting on new-outbox-event notifications."""
+
+    async def wait_for_events(self, timeout: float) -> bool:
+        """Wait until new events are signalled or the timeout elapses.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            True if woken by a notification, False on timeout
+
+        """
+        ...
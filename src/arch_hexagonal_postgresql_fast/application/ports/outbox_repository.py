@@ -2,36 +2,32 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
 
+@dataclass(frozen=True, slots=True)
 class OutboxEvent:
-    """Outbox event data structure."""
-
-    def __init__(
-        self,
-        id: UUID,  # noqa: A002
-        aggregate_type: str,
-        aggregate_id: str,
-        event_type: str,
-        payload: dict[str, object],
-        created_at: datetime,
-        published_at: datetime | None = None,
-        attempts: int = 0,
-        last_error: str | None = None,
-    ) -> None:
-        """Initialize outbox event."""
-        self.id = id
-        self.aggregate_type = aggregate_type
-        self.aggregate_id = aggregate_id
-        self.event_type = event_type
-        self.payload = payload
-        self.created_at = created_at
-        self.published_at = published_at
-        self.attempts = attempts
-        self.last_error = last_error
+    """Outbox event data structure.
+
+    Slotted: a poll materializes up to a batch of these, and slots drop the
+    per-instance ``__dict__``. Field order is the row order the repository
+    unpacks into the constructor.
+    """
+
+    id: UUID
+    aggregate_type: str
+    aggregate_id: str
+    event_type: str
+    payload: dict[str, object]
+    created_at: datetime
+    published_at: datetime | None = None
+    attempts: int = 0
+    last_error: str | None = None
 
 
 class OutboxRepository(Protocol):
@@ -46,11 +42,24 @@ class OutboxRepository(Protocol):
         """
         ...
 
-    async def get_unpublished(self, limit: int = 100) -> list[OutboxEvent]:
+    async def save_many(self, events: list[OutboxEvent]) -> None:
+        """Save several outbox events in one batched insert.
+
+        Args:
+            events: Outbox events to save
+
+        """
+        ...
+
+    async def get_unpublished(self, limit: int = 100, max_attempts: int = 5) -> list[OutboxEvent]:
         """Get unpublished events ordered by creation time.
 
+        Events that already used up their attempts are left to the DLQ
+        process, so they cannot hold the head of the queue.
+
         Args:
             limit: Maximum number of events to retrieve
+            max_attempts: Events with this many attempts or more are skipped
 
         Returns:
             List of unpublished outbox events
@@ -58,6 +67,25 @@ class OutboxRepository(Protocol):
         """
         ...
 
+    def iter_unpublished(
+        self, limit: int = 100, max_attempts: int = 5
+    ) -> AsyncIterator[OutboxEvent]:
+        """Stream unpublished events ordered by creation time.
+
+        Same selection and row locking as ``get_unpublished``, but rows are
+        read from a server-side cursor, so a caller can start publishing
+        after the first row instead of holding the whole batch in memory.
+
+        Args:
+            limit: Maximum number of events to retrieve
+            max_attempts: Events with this many attempts or more are skipped
+
+        Yields:
+            Unpublished events in creation order
+
+        """
+        ...
+
     async def mark_published(self, event_id: UUID) -> None:
         """Mark event as successfully published.
 
@@ -67,6 +95,15 @@ class OutboxRepository(Protocol):
         """
         ...
 
+    async def mark_published_many(self, event_ids: list[UUID]) -> None:
+        """Mark several events as successfully published.
+
+        Args:
+            event_ids: IDs of the events to mark as published
+
+        """
+        ...
+
     async def increment_attempts(self, event_id: UUID, error: str) -> None:
         """Increment retry attempts and record error.
 
@@ -77,6 +114,27 @@ class OutboxRepository(Protocol):
         """
         ...
 
+    async def increment_attempts_many(self, failures: list[tuple[UUID, str]]) -> None:
+        """Increment retry attempts and record errors for several events.
+
+        Args:
+            failures: (event ID, error message) pairs from failed attempts
+
+        """
+        ...
+
+    def transaction(self) -> AbstractAsyncContextManager[OutboxRepository]:
+        """Scope several operations to one database transaction.
+
+        Rows locked by ``get_unpublished`` inside the scope stay locked until
+        it exits, so a batch can be claimed, published and marked atomically.
+
+        Returns:
+            Async context manager yielding a repository bound to the transaction
+
+        """
+        ...
+
     async def get_failed(self, max_attempts: int = 5) -> list[OutboxEvent]:
         """Get events that exceeded max retry attempts.
 
@@ -88,3 +146,30 @@ class OutboxRepository(Protocol):
 
         """
         ...
+
+    def iter_failed(self, max_attempts: int = 5) -> AsyncIterator[OutboxEvent]:
+        """Stream events that exceeded max retry attempts.
+
+        Rows are fetched from a server-side cursor in batches, so memory stays
+        bounded however many events have failed.
+
+        Args:
+            max_attempts: Maximum number of allowed attempts
+
+        Yields:
+            Failed events in creation order
+
+        """
+        ...
+
+    async def count_failed(self, max_attempts: int = 5) -> int:
+        """Count events that exceeded max retry attempts without loading them.
+
+        Args:
+            max_attempts: Maximum number of allowed attempts
+
+        Returns:
+            Number of failed events
+
+        """
+        ...
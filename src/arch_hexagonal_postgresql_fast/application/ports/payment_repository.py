@@ -4,14 +4,32 @@ from __future__ import annotations
 
 from typing import Protocol
 
+from arch_hexagonal_postgresql_fast.application.ports.outbox_repository import (
+    OutboxEvent,
+)
 from arch_hexagonal_postgresql_fast.domain.entities.payment import Payment
+from arch_hexagonal_postgresql_fast.domain.entities.transaction import Transaction
 
 
 class PaymentRepository(Protocol):
     """Repository interface for payment persistence."""
 
     async def save(self, payment: Payment) -> None:
-        """Save or update a payment."""
+        """Save or update a payment; committed by the unit of work."""
+        ...
+
+    async def save_with_outbox(
+        self,
+        payment: Payment,
+        event: OutboxEvent,
+        transaction: Transaction | None = None,
+    ) -> None:
+        """Save a payment, an optional new transaction and an outbox event, and commit.
+
+        Unlike the other writes this commits the session itself: it is the
+        durability point of a payment state change. Anything flushed
+        earlier through the same unit of work is committed with it.
+        """
         ...
 
     async def get_by_id(self, payment_id: str) -> Payment | None:
@@ -23,5 +41,5 @@ class PaymentRepository(Protocol):
         ...
 
     async def delete(self, payment_id: str) -> None:
-        """Delete a payment."""
+        """Delete a payment; committed by the unit of work."""
         ...
@@ -13,7 +13,7 @@ class TransactionRepository(Protocol):
     """Repository interface for transaction persistence."""
 
     async def save(self, transaction: Transaction) -> None:
-        """Save a transaction."""
+        """Save a transaction; committed by the unit of work."""
         ...
 
     async def get_by_id(self, transaction_id: str) -> Transaction | None:
@@ -0,0 +1,37 @@
+"""Unit of work port."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+from arch_hexagonal_postgresql_fast.application.ports.outbox_repository import (
+    OutboxRepository,
+)
+from arch_hexagonal_postgresql_fast.application.ports.payment_repository import (
+    PaymentRepository,
+)
+from arch_hexagonal_postgresql_fast.application.ports.transaction_repository import (
+    TransactionRepository,
+)
+
+
+class UnitOfWork(Protocol):
+    """Repositories sharing a single database session.
+
+    Repository writes are only flushed; ``commit`` makes everything written
+    through the unit of work durable in one transaction. The exception is
+    ``payments.save_with_outbox``, which commits itself, and with it
+    everything flushed before.
+    """
+
+    payments: PaymentRepository
+    transactions: TransactionRepository
+    outbox: OutboxRepository
+
+    async def commit(self) -> None:
+        """Commit all pending writes."""
+        ...
+
+    async def rollback(self) -> None:
+        """Discard all pending writes."""
+        ...
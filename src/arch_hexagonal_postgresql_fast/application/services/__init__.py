@@ -3,5 +3,6 @@
 from __future__ import annotations
 
 from .outbox_publisher import OutboxPublisherService
+from .request_coalescer import RequestCoalescer
 
-__all__ = ["OutboxPublisherService"]
+__all__ = ["OutboxPublisherService", "RequestCoalescer"]
@@ -2,38 +2,54 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from functools import lru_cache
 from uuid import UUID
 
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-)
-
 from arch_hexagonal_postgresql_fast.application.ports.event_publisher import (
     EventPublisher,
 )
 from arch_hexagonal_postgresql_fast.application.ports.outbox_repository import (
+    OutboxEvent,
     OutboxRepository,
 )
 
 logger = logging.getLogger(__name__)
 
+_PUBLISH_ATTEMPTS = 3
+# Backoff before retry n (0-based) is 2**n seconds, capped here
+_MAX_BACKOFF_SECONDS = 10
+
+
+@lru_cache(maxsize=32)
+def _routing_key_for(aggregate_type: str) -> str:
+    """Routing key for an aggregate type, e.g. "Payment" -> "payments"."""
+    return f"{aggregate_type.lower()}s"
+
 
 class OutboxPublisherService:
-    """Service for publishing outbox events to message queue."""
+    """Service for publishing outbox events to message queue.
+
+    A batch is claimed, published and marked inside one repository
+    transaction, so the claimed rows stay locked until their outcome is
+    recorded. Events are streamed from the repository and published
+    concurrently, up to ``max_concurrency`` at a time; the database
+    bookkeeping runs after the broker calls, on the same transaction.
+    """
 
     def __init__(
         self,
         outbox_repo: OutboxRepository,
         event_publisher: EventPublisher,
         max_attempts: int = 5,
+        max_concurrency: int = 32,
     ) -> None:
         """Initialize outbox publisher service."""
         self._outbox_repo = outbox_repo
         self._event_publisher = event_publisher
         self._max_attempts = max_attempts
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
     async def publish_pending_events(self, batch_size: int = 100) -> int:
         """Publish pending events from outbox.
@@ -45,48 +61,67 @@ class OutboxPublisherService:
             Number of successfully published events
 
         """
-        events = await self._outbox_repo.get_unpublished(limit=batch_size)
-        published_count = 0
-
-        for event in events:
-            try:
-                await self._publish_event_with_retry(event.id)
-                published_count += 1
-            except Exception:  # noqa: S110 # nosec B110
-                # Logged in _publish_event_with_retry
-                # Event will be moved to DLQ by separate process
-                pass
-
-        return published_count
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _publish_event_with_retry(self, event_id: UUID) -> None:
-        """Publish single event with retry logic."""
-        # Get fresh event data
-        events = await self._outbox_repo.get_unpublished(limit=1000)
-        event = next((e for e in events if e.id == event_id), None)
-
-        if event is None or event.published_at is not None:
-            # Already published or deleted
-            return
-
+        published_ids: list[UUID] = []
+        failures: list[tuple[UUID, str]] = []
+        async with self._outbox_repo.transaction() as repo:
+            async with asyncio.TaskGroup() as group:
+                async for event in repo.iter_unpublished(
+                    limit=batch_size, max_attempts=self._max_attempts
+                ):
+                    # Reading pauses while every slot is busy, so at most
+                    # max_concurrency events are held in memory at once
+                    await self._semaphore.acquire()
+                    group.create_task(self._publish_tracked(event, published_ids, failures))
+
+            # Mark as published only after successful send; both outcomes are
+            # written with one statement each, whatever the batch size
+            await repo.mark_published_many(published_ids)
+            await repo.increment_attempts_many(failures)
+
+        return len(published_ids)
+
+    async def _publish_tracked(
+        self,
+        event: OutboxEvent,
+        published_ids: list[UUID],
+        failures: list[tuple[UUID, str]],
+    ) -> None:
+        """Publish one event, record its outcome and free its concurrency slot."""
         try:
-            # Publish to message queue via generic publish_event method
-            routing_key = f"{event.aggregate_type.lower()}s"  # e.g., "payments"
-            await self._event_publisher.publish_event(
-                event_type=event.event_type,
-                payload=event.payload,
-                routing_key=routing_key,
-            )
-
-            # Mark as published only after successful send
-            await self._outbox_repo.mark_published(event_id)
-
-            logger.info(
+            await self._publish_event_with_retry(event)
+        except Exception as e:
+            # Failures are collected so one bad event does not abort the batch.
+            # Event will be moved to DLQ by separate process.
+            logger.warning("Failed to publish event %s: %s", event.id, e)
+            failures.append((event.id, str(e)))
+        else:
+            published_ids.append(event.id)
+        finally:
+            self._semaphore.release()
+
+    async def _publish_event_with_retry(self, event: OutboxEvent) -> None:
+        """Publish single event to the message queue with retry logic.
+
+        A plain loop rather than a retry decorator: the first attempt almost
+        always succeeds and should not pay for building retry state.
+        """
+        routing_key = _routing_key_for(event.aggregate_type)
+        for attempt in range(_PUBLISH_ATTEMPTS):
+            try:
+                await self._event_publisher.publish_event(
+                    event_type=event.event_type,
+                    payload=event.payload,
+                    routing_key=routing_key,
+                )
+                break
+            except Exception:
+                if attempt == _PUBLISH_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(min(_MAX_BACKOFF_SECONDS, 2**attempt))
+
+        # Per event at DEBUG; the worker logs a per-batch count at INFO
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
                 "Published event %s: %s for %s/%s",
                 event.id,
                 event.event_type,
@@ -94,13 +129,6 @@ class OutboxPublisherService:
                 event.aggregate_id,
             )
 
-        except Exception as e:
-            # Record failure
-            await self._outbox_repo.increment_attempts(event_id, str(e))
-            logger.warning("Failed to publish event %s: %s", event_id, e)
-            raise
-
     async def get_failed_events_count(self) -> int:
         """Get count of events that exceeded max attempts."""
-        failed = await self._outbox_repo.get_failed(max_attempts=self._max_attempts)
-        return len(failed)
+        return await self._outbox_repo.count_failed(max_attempts=self._max_attempts)
@@ -0,0 +1,55 @@
+"""In-process coalescing of concurrent requests sharing an idempotency key."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+
+class RequestCoalescer[T]:
+    """Run one operation per key and share its outcome with concurrent callers.
+
+    Retries that arrive while the first request is still running await the
+    same task instead of racing it to the idempotency store. A successful
+    result stays cached for ``ttl_seconds`` so immediate retries skip the
+    store round trip entirely; failures are forgotten as soon as they happen.
+    The idempotency store remains the source of truth across processes.
+    """
+
+    def __init__(self, ttl_seconds: float = 5.0) -> None:
+        """Initialize coalescer."""
+        self._ttl = ttl_seconds
+        self._inflight: dict[str, asyncio.Task[T]] = {}
+
+    async def run(self, key: str, operation: Callable[[], Awaitable[T]]) -> T:
+        """Run ``operation`` for ``key`` or join the one already running.
+
+        Args:
+            key: Idempotency key identifying the request
+            operation: Zero-argument coroutine factory performing the work.
+                Its task can outlive the caller that started it, so it must
+                not use resources scoped to that caller, such as a
+                request's database session.
+
+        Returns:
+            Result of the single execution for this key
+
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(operation())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        # Shielded so a disconnecting caller does not cancel work others await
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Task[T]) -> None:
+        """Evict failed tasks immediately and successful ones after the TTL."""
+        if task.cancelled() or task.exception() is not None:
+            self._evict(key, task)
+        else:
+            asyncio.get_running_loop().call_later(self._ttl, self._evict, key, task)
+
+    def _evict(self, key: str, task: asyncio.Task[T]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
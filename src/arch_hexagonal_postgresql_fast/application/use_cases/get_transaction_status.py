@@ -14,14 +14,14 @@ from arch_hexagonal_postgresql_fast.application.ports.transaction_repository imp
 from arch_hexagonal_postgresql_fast.domain.exceptions import PaymentNotFoundError
 
 
-@dataclass
+@dataclass(slots=True)
 class GetTransactionStatusRequest:
     """Request to get transaction status."""
 
     payment_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionInfo:
     """Transaction information."""
 
@@ -33,7 +33,7 @@ class TransactionInfo:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class GetTransactionStatusResponse:
     """Response with transaction status."""
 
@@ -48,6 +48,8 @@ class GetTransactionStatusResponse:
 class GetTransactionStatus:
     """Use case for getting transaction status."""
 
+    __slots__ = ("_payment_repo", "_transaction_repo")
+
     def __init__(
         self,
         payment_repository: PaymentRepository,
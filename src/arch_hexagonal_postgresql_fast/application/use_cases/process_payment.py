@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import uuid
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import datetime
 
 from arch_hexagonal_postgresql_fast.application.ports.event_publisher import (
     EventPublisher,
@@ -38,7 +38,7 @@ from arch_hexagonal_postgresql_fast.domain.value_objects.transaction_status impo
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessPaymentRequest:
     """Request to process a payment."""
 
@@ -50,7 +50,7 @@ class ProcessPaymentRequest:
     metadata: dict[str, str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessPaymentResponse:
     """Response from processing a payment."""
 
@@ -63,6 +63,15 @@ class ProcessPaymentResponse:
 class ProcessPayment:
     """Use case for processing a payment."""
 
+    __slots__ = (
+        "_events",
+        "_idempotency",
+        "_outbox_repo",
+        "_payment_repo",
+        "_provider",
+        "_transaction_repo",
+    )
+
     def __init__(
         self,
         payment_repository: PaymentRepository,
@@ -82,17 +91,17 @@ class ProcessPayment:
 
     async def execute(self, request: ProcessPaymentRequest) -> ProcessPaymentResponse:
         """Execute the payment processing use case."""
-        # Check idempotency
-        if await self._idempotency.is_duplicate(request.idempotency_key):
-            cached = await self._idempotency.get_result(request.idempotency_key)
-            if cached:
-                # Parse created_at string back to datetime if needed
-                if isinstance(cached.get("created_at"), str):
-                    cached["created_at"] = datetime.fromisoformat(cached["created_at"])
-                return ProcessPaymentResponse(**cached)
-
-        # Create payment entity
-        payment_id = str(uuid.uuid4())
+        # Check idempotency: one GET, a miss and an unused key are the same
+        cached = await self._idempotency.get_result(request.idempotency_key)
+        if cached:
+            # Entries cached before created_at was stored as a datetime
+            if isinstance(cached.get("created_at"), str):
+                cached["created_at"] = datetime.fromisoformat(cached["created_at"])
+            return ProcessPaymentResponse(**cached)
+
+        # Create payment entity. Time-ordered UUIDv7 ids keep primary key
+        # inserts at the right edge of the B-tree instead of random pages.
+        payment_id = str(uuid.uuid7())
         payment = Payment(
             id=payment_id,
             customer_id=request.customer_id,
@@ -103,20 +112,22 @@ class ProcessPayment:
             metadata=request.metadata or {},
         )
 
-        # Save payment and event to outbox (transactional)
-        await self._payment_repo.save(payment)
-        await self._save_event_to_outbox(
-            aggregate_type="Payment",
-            aggregate_id=payment.id,
-            event_type="PaymentCreated",
-            payload={
-                "payment_id": payment.id,
-                "customer_id": payment.customer_id,
-                "amount": str(payment.amount.value),
-                "currency": payment.amount.currency,
-                "payment_method": payment.payment_method.value,
-                "status": payment.status.value,
-            },
+        # Save payment and its event to the outbox in one write
+        await self._payment_repo.save_with_outbox(
+            payment,
+            self._outbox_event(
+                aggregate_id=payment.id,
+                created_at=payment.updated_at,
+                event_type="PaymentCreated",
+                payload={
+                    "payment_id": payment.id,
+                    "customer_id": payment.customer_id,
+                    "amount_cents": payment.amount.to_cents(),
+                    "currency": payment.amount.currency,
+                    "payment_method": payment.payment_method.value,
+                    "status": payment.status.value,
+                },
+            ),
         )
 
         try:
@@ -129,41 +140,35 @@ class ProcessPayment:
                 metadata=request.metadata,
             )
 
-            # Mark as processing
             payment.mark_processing(provider_tx_id)
-            await self._payment_repo.save(payment)
-
-            # Create transaction record
+            payment.mark_completed()
             transaction = Transaction(
-                id=str(uuid.uuid4()),
+                id=str(uuid.uuid7()),
                 payment_id=payment.id,
                 amount=request.amount,
                 transaction_type="charge",
-                status=TransactionStatus.PROCESSING,
+                status=TransactionStatus.COMPLETED,
                 provider=self._provider.name,
                 provider_transaction_id=provider_tx_id,
             )
-            await self._transaction_repo.save(transaction)
-
-            # Mark as completed
-            payment.mark_completed()
-            transaction.status = TransactionStatus.COMPLETED
-            await self._payment_repo.save(payment)
-            await self._transaction_repo.save(transaction)
 
-            # Save success event to outbox (transactional)
-            await self._save_event_to_outbox(
-                aggregate_type="Payment",
-                aggregate_id=payment.id,
-                event_type="PaymentCompleted",
-                payload={
-                    "payment_id": payment.id,
-                    "customer_id": payment.customer_id,
-                    "amount": str(payment.amount.value),
-                    "currency": payment.amount.currency,
-                    "provider_transaction_id": provider_tx_id,
-                    "status": payment.status.value,
-                },
+            # Persist final state, transaction and success event together
+            await self._payment_repo.save_with_outbox(
+                payment,
+                self._outbox_event(
+                    aggregate_id=payment.id,
+                    created_at=payment.updated_at,
+                    event_type="PaymentCompleted",
+                    payload={
+                        "payment_id": payment.id,
+                        "customer_id": payment.customer_id,
+                        "amount_cents": payment.amount.to_cents(),
+                        "currency": payment.amount.currency,
+                        "provider_transaction_id": provider_tx_id,
+                        "status": payment.status.value,
+                    },
+                ),
+                transaction,
             )
 
             response = ProcessPaymentResponse(
@@ -173,27 +178,24 @@ class ProcessPayment:
                 created_at=payment.created_at,
             )
 
-            # Cache result
-            await self._idempotency.store_result(
+            # Cache result; a concurrent duplicate that finished first keeps its entry
+            await self._idempotency.claim(
                 request.idempotency_key,
                 {
                     "payment_id": response.payment_id,
                     "status": response.status,
                     "provider_transaction_id": response.provider_transaction_id,
-                    "created_at": response.created_at.isoformat(),
+                    # MessagePack keeps it a datetime: no parse on a cache hit
+                    "created_at": response.created_at,
                 },
             )
 
             return response
 
         except Exception as e:
-            # Mark as failed
             payment.mark_failed()
-            await self._payment_repo.save(payment)
-
-            # Create failed transaction
             failed_tx = Transaction(
-                id=str(uuid.uuid4()),
+                id=str(uuid.uuid7()),
                 payment_id=payment.id,
                 amount=request.amount,
                 transaction_type="charge",
@@ -201,39 +203,45 @@ class ProcessPayment:
                 provider=self._provider.name,
                 error_message=str(e),
             )
-            await self._transaction_repo.save(failed_tx)
 
-            # Save failure event to outbox (transactional)
-            await self._save_event_to_outbox(
-                aggregate_type="Payment",
-                aggregate_id=payment.id,
-                event_type="PaymentFailed",
-                payload={
-                    "payment_id": payment.id,
-                    "customer_id": payment.customer_id,
-                    "amount": str(payment.amount.value),
-                    "currency": payment.amount.currency,
-                    "error": str(e),
-                    "status": payment.status.value,
-                },
+            # Persist failed state, transaction and failure event together
+            await self._payment_repo.save_with_outbox(
+                payment,
+                self._outbox_event(
+                    aggregate_id=payment.id,
+                    created_at=payment.updated_at,
+                    event_type="PaymentFailed",
+                    payload={
+                        "payment_id": payment.id,
+                        "customer_id": payment.customer_id,
+                        "amount_cents": payment.amount.to_cents(),
+                        "currency": payment.amount.currency,
+                        "error": str(e),
+                        "status": payment.status.value,
+                    },
+                ),
+                failed_tx,
             )
 
             raise
 
-    async def _save_event_to_outbox(
-        self,
-        aggregate_type: str,
+    @staticmethod
+    def _outbox_event(
         aggregate_id: str,
+        created_at: datetime,
         event_type: str,
         payload: dict[str, object],
-    ) -> None:
-        """Save event to outbox for reliable publishing."""
-        event = OutboxEvent(
-            id=uuid.uuid4(),
-            aggregate_type=aggregate_type,
+    ) -> OutboxEvent:
+        """Build a payment event for the outbox.
+
+        ``created_at`` is the payment's own change time rather than a fresh
+        clock read; the repositories let the database stamp the row anyway.
+        """
+        return OutboxEvent(
+            id=uuid.uuid7(),
+            aggregate_type="Payment",
             aggregate_id=aggregate_id,
             event_type=event_type,
             payload=payload,
-            created_at=datetime.now(UTC),
+            created_at=created_at,
         )
-        await self._outbox_repo.save(event)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import uuid
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import datetime
 
 from arch_hexagonal_postgresql_fast.application.ports.event_publisher import (
     EventPublisher,
@@ -35,7 +35,7 @@ from arch_hexagonal_postgresql_fast.domain.value_objects.transaction_status impo
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class RefundPaymentRequest:
     """Request to refund a payment."""
 
@@ -44,7 +44,7 @@ class RefundPaymentRequest:
     idempotency_key: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RefundPaymentResponse:
     """Response from refunding a payment."""
 
@@ -58,6 +58,15 @@ class RefundPaymentResponse:
 class RefundPayment:
     """Use case for refunding a payment."""
 
+    __slots__ = (
+        "_events",
+        "_idempotency",
+        "_outbox_repo",
+        "_payment_repo",
+        "_provider",
+        "_transaction_repo",
+    )
+
     def __init__(
         self,
         payment_repository: PaymentRepository,
@@ -79,10 +88,9 @@ class RefundPayment:
         """Execute the refund use case."""
         # Check idempotency
         idempotency_key = request.idempotency_key or str(uuid.uuid4())
-        if await self._idempotency.is_duplicate(idempotency_key):
-            cached = await self._idempotency.get_result(idempotency_key)
-            if cached:
-                return RefundPaymentResponse(**cached)
+        cached = await self._idempotency.get_result(idempotency_key)
+        if cached:
+            return RefundPaymentResponse(**cached)
 
         # Get payment
         payment = await self._payment_repo.get_by_id(request.payment_id)
@@ -106,13 +114,10 @@ class RefundPayment:
             idempotency_key=idempotency_key,
         )
 
-        # Update payment
+        # Update payment and record the refund transaction
         payment.refund(refund_amount)
-        await self._payment_repo.save(payment)
-
-        # Create transaction record
         transaction = Transaction(
-            id=str(uuid.uuid4()),
+            id=str(uuid.uuid7()),
             payment_id=payment.id,
             amount=refund_amount,
             transaction_type="refund",
@@ -120,21 +125,24 @@ class RefundPayment:
             provider=self._provider.name,
             provider_transaction_id=refund_tx_id,
         )
-        await self._transaction_repo.save(transaction)
 
-        # Save event to outbox (transactional)
-        await self._save_event_to_outbox(
-            aggregate_type="Payment",
-            aggregate_id=payment.id,
-            event_type="PaymentRefunded",
-            payload={
-                "payment_id": payment.id,
-                "customer_id": payment.customer_id,
-                "refund_amount": str(refund_amount),
-                "currency": payment.amount.currency,
-                "refund_transaction_id": refund_tx_id,
-                "status": payment.status.value,
-            },
+        # Persist refunded state, transaction and refund event together
+        await self._payment_repo.save_with_outbox(
+            payment,
+            self._outbox_event(
+                aggregate_id=payment.id,
+                created_at=payment.updated_at,
+                event_type="PaymentRefunded",
+                payload={
+                    "payment_id": payment.id,
+                    "customer_id": payment.customer_id,
+                    "refund_amount_cents": refund_amount.to_cents(),
+                    "currency": refund_amount.currency,
+                    "refund_transaction_id": refund_tx_id,
+                    "status": payment.status.value,
+                },
+            ),
+            transaction,
         )
 
         response = RefundPaymentResponse(
@@ -145,34 +153,34 @@ class RefundPayment:
             created_at=transaction.created_at,
         )
 
-        # Cache result
-        await self._idempotency.store_result(
+        # Cache result; a concurrent duplicate that finished first keeps its entry
+        await self._idempotency.claim(
             idempotency_key,
             {
                 "payment_id": response.payment_id,
                 "refund_amount": response.refund_amount,
                 "status": response.status,
                 "refund_transaction_id": response.refund_transaction_id,
-                "created_at": response.created_at.isoformat(),
+                # MessagePack keeps it a datetime: no parse on a cache hit
+                "created_at": response.created_at,
             },
         )
 
         return response
 
-    async def _save_event_to_outbox(
-        self,
-        aggregate_type: str,
+    @staticmethod
+    def _outbox_event(
         aggregate_id: str,
+        created_at: datetime,
         event_type: str,
         payload: dict[str, object],
-    ) -> None:
-        """Save event to outbox for reliable publishing."""
-        event = OutboxEvent(
-            id=uuid.uuid4(),
-            aggregate_type=aggregate_type,
+    ) -> OutboxEvent:
+        """Build a payment event for the outbox, timed like the payment change."""
+        return OutboxEvent(
+            id=uuid.uuid7(),
+            aggregate_type="Payment",
             aggregate_id=aggregate_id,
             event_type=event_type,
             payload=payload,
-            created_at=datetime.now(UTC),
+            created_at=created_at,
         )
-        await self._outbox_repo.save(event)
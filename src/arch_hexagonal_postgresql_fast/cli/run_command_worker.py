@@ -5,15 +5,17 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-from arch_hexagonal_postgresql_fast.adapters.database.postgresql_outbox_repository import (
-    PostgreSQLOutboxRepository,
-)
-from arch_hexagonal_postgresql_fast.adapters.database.postgresql_payment_repository import (
-    PostgreSQLPaymentRepository,
+import uvloop
+
+from arch_hexagonal_postgresql_fast.adapters.database.engine import create_engine
+from arch_hexagonal_postgresql_fast.adapters.database.unit_of_work import (
+    SQLAlchemyUnitOfWork,
 )
-from arch_hexagonal_postgresql_fast.adapters.database.postgresql_transaction_repository import (
-    PostgreSQLTransactionRepository,
+from arch_hexagonal_postgresql_fast.adapters.idempotency.caching_store import (
+    CachingIdempotencyStore,
 )
 from arch_hexagonal_postgresql_fast.adapters.idempotency.redis_store import (
     RedisIdempotencyStore,
@@ -52,70 +54,77 @@ async def main() -> None:
     logger.info("RabbitMQ: %s", settings.rabbitmq_url.split("@")[-1])
 
     # Create database session
-    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.ext.asyncio import async_sessionmaker
 
-    engine = create_async_engine(settings.database_url, echo=False)
+    engine = create_engine(settings)
     session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
-    # Create dependencies
-    async with session_maker() as session:
-        # Repositories
-        payment_repo = PostgreSQLPaymentRepository(session)
-        transaction_repo = PostgreSQLTransactionRepository(session)
-        outbox_repo = PostgreSQLOutboxRepository(session)
-
-        # External services
-        event_publisher = RabbitMQEventPublisher(settings.rabbitmq_url)
-        await event_publisher.connect()
-
-        payment_provider = StripeAdapter(settings.stripe_api_key)
-
-        idempotency_store = RedisIdempotencyStore(settings.redis_url)
-        await idempotency_store.connect()
-
-        try:
-            # Use cases
-            process_payment_uc = ProcessPayment(
-                payment_repository=payment_repo,
-                transaction_repository=transaction_repo,
+    # External services. Durable events go through the outbox and its own
+    # confirmed publisher; anything published directly here is fire-and-forget.
+    event_publisher = RabbitMQEventPublisher(settings.rabbitmq_url, publisher_confirms=False)
+    await event_publisher.connect()
+
+    payment_provider = StripeAdapter(settings.stripe_api_key)
+
+    redis_store = RedisIdempotencyStore(settings.redis_url)
+    await redis_store.connect()
+    idempotency_store = CachingIdempotencyStore(
+        redis_store,
+        maxsize=settings.idempotency_cache_size,
+        ttl=settings.idempotency_cache_ttl_seconds,
+    )
+
+    # Commands are handled concurrently (up to the prefetch count), and a
+    # session cannot be shared between tasks: give each message its own.
+    @asynccontextmanager
+    async def process_payment_scope() -> AsyncIterator[ProcessPayment]:
+        async with session_maker() as session:
+            uow = SQLAlchemyUnitOfWork(session)
+            yield ProcessPayment(
+                payment_repository=uow.payments,
+                transaction_repository=uow.transactions,
                 payment_provider=payment_provider,
                 event_publisher=event_publisher,
                 idempotency_store=idempotency_store,
-                outbox_repository=outbox_repo,
+                outbox_repository=uow.outbox,
             )
 
-            # Handler
-            handler = CommandHandler(
-                process_payment_use_case=process_payment_uc,
-            )
+    # Consumer
+    consumer = RabbitMQCommandConsumer(
+        settings.rabbitmq_url,
+        prefetch_count=settings.command_prefetch_count,
+    )
 
-            # Consumer
-            consumer = RabbitMQCommandConsumer(settings.rabbitmq_url)
-            await consumer.connect()
+    try:
+        # Handler
+        handler = CommandHandler(process_payment_scope=process_payment_scope)
 
-            # Worker
-            worker = CommandWorker(
-                consumer=consumer,
-                handler=handler,
-                queue_name="payment.commands.process",
-            )
+        await consumer.connect()
 
-            await worker.start()
+        # Worker
+        worker = CommandWorker(
+            consumer=consumer,
+            handler=handler,
+            queue_name="payment.commands.process",
+        )
 
-        except KeyboardInterrupt:
-            logger.info("Received shutdown signal")
-        finally:
-            await consumer.disconnect()
-            await event_publisher.disconnect()
-            await idempotency_store.disconnect()
-            await engine.dispose()
+        await worker.start()
+
+    except KeyboardInterrupt:
+        logger.info("Received shutdown signal")
+    finally:
+        await consumer.disconnect()
+        await event_publisher.disconnect()
+        await redis_store.disconnect()
+        await payment_provider.close()
+        await engine.dispose()
 
     logger.info("Command Worker stopped")
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
     except KeyboardInterrupt:
         logger.info("Shutdown complete")
         sys.exit(0)
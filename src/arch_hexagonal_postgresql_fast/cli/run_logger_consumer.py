@@ -6,6 +6,8 @@ import asyncio
 import logging
 import sys
 
+import uvloop
+
 from arch_hexagonal_postgresql_fast.config import Settings
 from arch_hexagonal_postgresql_fast.workers.logger_event_consumer import (
     LoggerEventConsumer,
@@ -39,7 +41,7 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
     except KeyboardInterrupt:
         logger.info("Shutdown complete")
         sys.exit(0)
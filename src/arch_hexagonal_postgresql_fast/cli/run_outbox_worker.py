@@ -6,8 +6,14 @@ import asyncio
 import logging
 import sys
 
-from arch_hexagonal_postgresql_fast.adapters.database.postgresql_outbox_repository import (
-    PostgreSQLOutboxRepository,
+import uvloop
+
+from arch_hexagonal_postgresql_fast.adapters.database.engine import create_engine
+from arch_hexagonal_postgresql_fast.adapters.database.outbox_listener import (
+    PostgreSQLOutboxListener,
+)
+from arch_hexagonal_postgresql_fast.adapters.database.session_outbox_repository import (
+    SessionManagedOutboxRepository,
 )
 from arch_hexagonal_postgresql_fast.adapters.messaging.rabbitmq_publisher import (
     RabbitMQEventPublisher,
@@ -34,52 +40,66 @@ async def main() -> None:
     logger.info("RabbitMQ: %s", settings.rabbitmq_url.split("@")[-1])
 
     # Create database session
-    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-    engine = create_async_engine(settings.database_url, echo=False)
+    engine = create_engine(settings)
     session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
-    # Create dependencies
-    async with session_maker() as session:
-        outbox_repo = PostgreSQLOutboxRepository(session)
-        event_publisher = RabbitMQEventPublisher(settings.rabbitmq_url)
-
-        # Connect to RabbitMQ
-        await event_publisher.connect()
-
-        try:
-            # Create publisher service
-            publisher_service = OutboxPublisherService(
-                outbox_repo=outbox_repo,
-                event_publisher=event_publisher,
-                max_attempts=5,
-            )
-
-            # Create and start worker
-            worker = OutboxWorker(
-                publisher_service=publisher_service,
-                interval_seconds=5,
-            )
-
-            await worker.start()
-
-            # Keep running
-            while True:
-                await asyncio.sleep(1)
-
-        except KeyboardInterrupt:
-            logger.info("Received shutdown signal")
-        finally:
-            await worker.stop()
-            await event_publisher.disconnect()
-            await engine.dispose()
+    # Create dependencies. Each batch runs inside transaction(): one session
+    # and one transaction (with synchronous_commit off) that claims, marks
+    # and records failures for the whole batch. Calls made outside
+    # transaction(), such as the failed-events count, get their own session.
+    async def create_session() -> AsyncSession:
+        return session_maker()
+
+    outbox_repo = SessionManagedOutboxRepository(create_session)
+    event_publisher = RabbitMQEventPublisher(settings.rabbitmq_url)
+
+    listener = (
+        PostgreSQLOutboxListener(settings.database_url) if settings.outbox_listen_enabled else None
+    )
+
+    # Connect to RabbitMQ
+    await event_publisher.connect()
+    if listener:
+        await listener.connect()
+
+    try:
+        # Create publisher service
+        publisher_service = OutboxPublisherService(
+            outbox_repo=outbox_repo,
+            event_publisher=event_publisher,
+            max_attempts=5,
+        )
+
+        # Create and start worker
+        worker = OutboxWorker(
+            publisher_service=publisher_service,
+            interval_seconds=settings.outbox_poll_interval_seconds,
+            listener=listener,
+        )
+
+        await worker.start()
+
+        # Keep running
+        while True:
+            await asyncio.sleep(1)
+
+    except KeyboardInterrupt:
+        logger.info("Received shutdown signal")
+    finally:
+        await worker.stop()
+        if listener:
+            await listener.disconnect()
+        await event_publisher.disconnect()
+        await engine.dispose()
 
     logger.info("Outbox Worker stopped")
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
     except KeyboardInterrupt:
         logger.info("Shutdown complete")
         sys.exit(0)
@@ -8,7 +8,7 @@ from decimal import Decimal
 from arch_hexagonal_postgresql_fast.domain.exceptions import InvalidAmountError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Amount:
     """Immutable money amount with currency."""
 
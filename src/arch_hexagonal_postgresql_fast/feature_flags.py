@@ -22,6 +22,11 @@ class FeatureFlags:
         os.getenv("ENABLE_OUTBOX_PATTERN", "true").lower() == "true"
     )
 
+    # Write payment, transaction and outbox rows with one CTE statement
+    ENABLE_SINGLE_STATEMENT_WRITES: ClassVar[bool] = (
+        os.getenv("ENABLE_SINGLE_STATEMENT_WRITES", "true").lower() == "true"
+    )
+
     # Retry mechanism
     ENABLE_RETRY_LOGIC: ClassVar[bool] = os.getenv("ENABLE_RETRY_LOGIC", "true").lower() == "true"
 
@@ -34,5 +39,6 @@ class FeatureFlags:
         logger.info("Feature Flags:")
         logger.info("  ENABLE_ASYNC_COMMANDS: %s", cls.ENABLE_ASYNC_COMMANDS)
         logger.info("  ENABLE_OUTBOX_PATTERN: %s", cls.ENABLE_OUTBOX_PATTERN)
+        logger.info("  ENABLE_SINGLE_STATEMENT_WRITES: %s", cls.ENABLE_SINGLE_STATEMENT_WRITES)
         logger.info("  ENABLE_RETRY_LOGIC: %s", cls.ENABLE_RETRY_LOGIC)
         logger.info("  ENABLE_COMPENSATION: %s", cls.ENABLE_COMPENSATION)
@@ -11,6 +11,8 @@ def main() -> None:
         "arch_hexagonal_postgresql_fast.adapters.api.fastapi_app:app",
         host="0.0.0.0",  # nosec B104 - Required for Docker/container environments
         port=8000,
+        loop="uvloop",
+        http="httptools",
         reload=True,
     )
 
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+from typing import Any
 
+import msgspec
+import uvloop
 from aio_pika import connect_robust
 from aio_pika.abc import AbstractConnection, AbstractIncomingMessage
 
 logger = logging.getLogger(__name__)
 
+_event_decoder = msgspec.json.Decoder(dict[str, Any])
+
 
 class LoggerEventConsumer:
     """Consumer that logs all payment events for observability."""
@@ -40,10 +44,14 @@ class LoggerEventConsumer:
             durable=True,
         )
 
-        # Declare queue for logging
+        # Declare queue for logging. Transient: it only feeds log lines, so
+        # losing backlog on a broker restart is acceptable and the broker
+        # skips writing queue metadata and messages to disk. Named apart
+        # from the old durable "payment.events.logger": redeclaring that
+        # one as transient fails with PRECONDITION_FAILED.
         queue = await channel.declare_queue(
-            "payment.events.logger",
-            durable=True,
+            "payment.events.logger.transient",
+            durable=False,
         )
 
         # Bind to all payment events
@@ -69,7 +77,7 @@ class LoggerEventConsumer:
         """Handle incoming event message."""
         async with message.process():
             try:
-                event = json.loads(message.body.decode())
+                event = _event_decoder.decode(message.body)
 
                 # Extract event details
                 event_type = event.get("event_type", "unknown")
@@ -115,4 +123,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=uvloop.new_event_loop)
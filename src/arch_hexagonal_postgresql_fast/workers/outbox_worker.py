@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 
+from arch_hexagonal_postgresql_fast.application.ports.outbox_listener import OutboxListener
 from arch_hexagonal_postgresql_fast.application.services.outbox_publisher import (
     OutboxPublisherService,
 )
@@ -13,16 +14,26 @@ logger = logging.getLogger(__name__)
 
 
 class OutboxWorker:
-    """Background worker for processing outbox events."""
+    """Background worker for processing outbox events.
+
+    With a listener the worker sleeps until new events are signalled and
+    only falls back to polling every ``interval_seconds`` as a safety net.
+    A full batch means more events are waiting, so the next batch is read
+    straight away.
+    """
 
     def __init__(
         self,
         publisher_service: OutboxPublisherService,
         interval_seconds: int = 5,
+        listener: OutboxListener | None = None,
+        batch_size: int = 100,
     ) -> None:
         """Initialize outbox worker."""
         self._publisher = publisher_service
         self._interval = interval_seconds
+        self._listener = listener
+        self._batch_size = batch_size
         self._running = False
         self._task: asyncio.Task[None] | None = None
 
@@ -53,8 +64,11 @@ class OutboxWorker:
     async def _run(self) -> None:
         """Main worker loop."""
         while self._running:
+            published_count = 0
             try:
-                published_count = await self._publisher.publish_pending_events()
+                published_count = await self._publisher.publish_pending_events(
+                    batch_size=self._batch_size,
+                )
                 if published_count > 0:
                     logger.info("Published %d outbox events", published_count)
 
@@ -65,5 +79,11 @@ class OutboxWorker:
             except Exception as e:
                 logger.error("Error in outbox worker: %s", e, exc_info=True)
 
-            # Wait before next iteration
-            await asyncio.sleep(self._interval)
+            if published_count >= self._batch_size:
+                continue
+
+            # Wait for new events before next iteration
+            if self._listener:
+                await self._listener.wait_for_events(timeout=self._interval)
+            else:
+                await asyncio.sleep(self._interval)
@@ -0,0 +1,3 @@
+"""API tests package."""
+
+from __future__ import annotations
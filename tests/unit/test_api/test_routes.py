@@ -0,0 +1,94 @@
+"""Tests for payment routes."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from arch_hexagonal_postgresql_fast.adapters.api import routes
+from arch_hexagonal_postgresql_fast.adapters.api.dependencies import PaymentServices
+from arch_hexagonal_postgresql_fast.adapters.api.routes import (
+    ProcessPaymentSchema,
+    process_payment,
+)
+from arch_hexagonal_postgresql_fast.application.services.request_coalescer import (
+    RequestCoalescer,
+)
+from arch_hexagonal_postgresql_fast.application.use_cases.process_payment import (
+    ProcessPaymentRequest,
+    ProcessPaymentResponse,
+)
+from arch_hexagonal_postgresql_fast.domain.value_objects.payment_method import (
+    PaymentMethod,
+)
+
+
+class TestProcessPaymentRoute:
+    """Test the process payment route."""
+
+    async def test_cancelled_first_caller_does_not_close_shared_session(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a retry waiting on a cancelled caller's execution still succeeds."""
+        log: list[str] = []
+        release = asyncio.Event()
+
+        @asynccontextmanager
+        async def open_uow() -> AsyncIterator[Mock]:
+            log.append("open")
+            try:
+                yield Mock()
+            finally:
+                log.append("close")
+
+        class FakeProcessPayment:
+            def __init__(self, *_: object) -> None:
+                pass
+
+            async def execute(self, request: ProcessPaymentRequest) -> ProcessPaymentResponse:
+                await release.wait()
+                log.append("execute")
+                return ProcessPaymentResponse(
+                    payment_id="pay_123",
+                    status="completed",
+                    provider_transaction_id="tx_123",
+                    created_at=datetime.now(UTC),
+                )
+
+        monkeypatch.setattr(routes, "open_uow", open_uow)
+        monkeypatch.setattr(routes, "ProcessPayment", FakeProcessPayment)
+
+        request = ProcessPaymentSchema(
+            customer_id="cus_123",
+            amount=Decimal("100.00"),
+            currency="USD",
+            payment_method=PaymentMethod.CREDIT_CARD,
+            payment_method_token="tok_123",
+            idempotency_key="idem_123",
+        )
+        services = PaymentServices(provider=Mock(), events=Mock(), idempotency=Mock())
+        coalescer: RequestCoalescer[ProcessPaymentResponse] = RequestCoalescer()
+
+        first = asyncio.create_task(process_payment(request, services, coalescer))
+        second = asyncio.create_task(process_payment(request, services, coalescer))
+        await asyncio.sleep(0)
+
+        # First client disconnects while the retry is still waiting
+        first.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await first
+        release.set()
+
+        result = await second
+
+        assert result.payment_id == "pay_123"
+        # One shared execution, whose session closed only after it finished
+        assert log == ["open", "execute", "close"]
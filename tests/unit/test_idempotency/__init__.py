@@ -0,0 +1,3 @@
+"""Idempotency tests package."""
+
+from __future__ import annotations
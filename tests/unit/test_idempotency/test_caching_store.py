@@ -0,0 +1,153 @@
+"""Tests for CachingIdempotencyStore."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from arch_hexagonal_postgresql_fast.adapters.idempotency import caching_store
+from arch_hexagonal_postgresql_fast.adapters.idempotency.caching_store import (
+    CachingIdempotencyStore,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the clock seen by the caching store only, not the event loop's."""
+    fake = FakeClock()
+    monkeypatch.setattr(caching_store, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def backing_store() -> Mock:
+    """Create mock backing idempotency store."""
+    store = Mock()
+    store.get_result = AsyncMock(return_value=None)
+    store.store_result = AsyncMock()
+    store.claim = AsyncMock(return_value=True)
+    store.store_many = AsyncMock()
+    store.delete = AsyncMock()
+    return store
+
+
+class TestCachingIdempotencyStore:
+    """Test CachingIdempotencyStore."""
+
+    async def test_hit_skips_backing_store(self, clock: FakeClock, backing_store: Mock) -> None:
+        """Test that a cached result is served without asking the backing store."""
+        backing_store.get_result = AsyncMock(return_value={"payment_id": "pay_123"})
+        store = CachingIdempotencyStore(backing_store, ttl=60)
+
+        await store.get_result("key")
+        result = await store.get_result("key")
+
+        assert result == {"payment_id": "pay_123"}
+        backing_store.get_result.assert_awaited_once_with("key")
+
+    async def test_miss_is_not_cached(self, clock: FakeClock, backing_store: Mock) -> None:
+        """Test that a key without a result is looked up every time."""
+        store = CachingIdempotencyStore(backing_store)
+
+        assert await store.get_result("key") is None
+        assert await store.get_result("key") is None
+
+        assert backing_store.get_result.await_count == 2
+
+    async def test_entry_expires_after_ttl(self, clock: FakeClock, backing_store: Mock) -> None:
+        """Test that an expired entry is fetched from the backing store again."""
+        backing_store.get_result = AsyncMock(return_value={"payment_id": "pay_123"})
+        store = CachingIdempotencyStore(backing_store, ttl=60)
+
+        await store.get_result("key")
+        clock.now = 60.0
+        await store.get_result("key")
+
+        assert backing_store.get_result.await_count == 2
+
+    async def test_write_ttl_shorter_than_cache_ttl(
+        self, clock: FakeClock, backing_store: Mock
+    ) -> None:
+        """Test that a result is not served locally after its backing key expires."""
+        store = CachingIdempotencyStore(backing_store, ttl=300)
+        await store.store_result("stored", {"payment_id": "pay_1"}, ttl=10)
+        await store.claim("claimed", {"payment_id": "pay_2"}, ttl=10)
+        await store.store_many({"many": {"payment_id": "pay_3"}}, ttl=10)
+
+        clock.now = 9.0
+        assert await store.get_result("stored") == {"payment_id": "pay_1"}
+        backing_store.get_result.assert_not_awaited()
+
+        clock.now = 10.0
+        assert await store.get_result("stored") is None
+        assert await store.get_result("claimed") is None
+        assert await store.get_result("many") is None
+        assert backing_store.get_result.await_count == 3
+
+    async def test_claim_caches_only_when_won(self, clock: FakeClock, backing_store: Mock) -> None:
+        """Test that a lost claim leaves the winner's result to the backing store."""
+        backing_store.claim = AsyncMock(side_effect=[True, False])
+        store = CachingIdempotencyStore(backing_store)
+
+        assert await store.claim("won", {"payment_id": "pay_1"}) is True
+        assert await store.claim("lost", {"payment_id": "pay_2"}) is False
+
+        assert await store.get_result("won") == {"payment_id": "pay_1"}
+        assert await store.get_result("lost") is None
+        backing_store.get_result.assert_awaited_once_with("lost")
+
+    async def test_delete_evicts(self, clock: FakeClock, backing_store: Mock) -> None:
+        """Test that delete removes the entry from the backing store and the cache."""
+        store = CachingIdempotencyStore(backing_store)
+        await store.store_result("key", {"payment_id": "pay_123"})
+
+        await store.delete("key")
+
+        backing_store.delete.assert_awaited_once_with("key")
+        assert await store.get_result("key") is None
+        backing_store.get_result.assert_awaited_once_with("key")
+
+    async def test_size_limit_evicts_least_recently_used(
+        self, clock: FakeClock, backing_store: Mock
+    ) -> None:
+        """Test that the least recently used entry is evicted when full."""
+        store = CachingIdempotencyStore(backing_store, maxsize=2)
+        await store.store_result("a", {"payment_id": "pay_a"})
+        await store.store_result("b", {"payment_id": "pay_b"})
+
+        # Reading "a" makes "b" the least recently used
+        await store.get_result("a")
+        await store.store_result("c", {"payment_id": "pay_c"})
+
+        assert await store.get_result("a") == {"payment_id": "pay_a"}
+        assert await store.get_result("c") == {"payment_id": "pay_c"}
+        backing_store.get_result.assert_not_awaited()
+        assert await store.get_result("b") is None
+        backing_store.get_result.assert_awaited_once_with("b")
+
+    async def test_returns_copies(self, clock: FakeClock, backing_store: Mock) -> None:
+        """Test that changing a returned or stored dict does not change the cache."""
+        store = CachingIdempotencyStore(backing_store)
+        stored = {"payment_id": "pay_123"}
+        await store.store_result("key", stored)
+
+        stored["payment_id"] = "changed"
+        result = await store.get_result("key")
+        assert result == {"payment_id": "pay_123"}
+
+        assert result is not None
+        result["payment_id"] = "changed"
+        assert await store.get_result("key") == {"payment_id": "pay_123"}
@@ -0,0 +1,3 @@
+"""Messaging tests package."""
+
+from __future__ import annotations
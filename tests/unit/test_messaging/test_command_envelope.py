@@ -0,0 +1,148 @@
+"""Tests for the command envelope wire format."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, nullcontext
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+import msgspec
+import pytest
+
+from arch_hexagonal_postgresql_fast.adapters.messaging.rabbitmq_command_publisher import (
+    COMMAND_CONTENT_TYPE,
+    CommandEnvelope,
+    _encode_envelope,
+    _envelope_prefix,
+)
+from arch_hexagonal_postgresql_fast.application.commands import ProcessPaymentCommand
+from arch_hexagonal_postgresql_fast.application.handlers.command_handler import (
+    CommandHandler,
+    ProcessPaymentPayload,
+    _msgpack_body_decoder,
+)
+from arch_hexagonal_postgresql_fast.domain.value_objects.amount import Amount
+from arch_hexagonal_postgresql_fast.domain.value_objects.payment_method import (
+    PaymentMethod,
+)
+
+
+@pytest.fixture
+def command() -> ProcessPaymentCommand:
+    """Create a process payment command."""
+    return ProcessPaymentCommand(
+        command_id="cmd_123",
+        idempotency_key="idem_123",
+        timestamp=datetime(2024, 1, 1, 12, 0, tzinfo=UTC),
+        customer_id="cus_123",
+        amount=Decimal("100.50"),
+        currency="USD",
+        payment_method="credit_card",
+        payment_method_token="tok_123",
+        metadata={"order_id": "ord_123"},
+    )
+
+
+@pytest.fixture
+def mock_process_payment() -> Mock:
+    """Create mock ProcessPayment use case."""
+    use_case = Mock()
+    use_case.execute = AsyncMock()
+    return use_case
+
+
+@pytest.fixture
+def handler(mock_process_payment: Mock) -> CommandHandler:
+    """Create command handler bound to the mock use case."""
+
+    @asynccontextmanager
+    async def scope() -> AsyncIterator[Mock]:
+        yield mock_process_payment
+
+    return CommandHandler(process_payment_scope=scope)
+
+
+def incoming(body: bytes, content_type: str) -> Mock:
+    """Create an incoming message carrying body."""
+    message = Mock()
+    message.body = body
+    message.content_type = content_type
+    message.process = Mock(side_effect=nullcontext)
+    return message
+
+
+class TestCommandEnvelope:
+    """Test the hand-built MessagePack command envelope."""
+
+    def test_matches_encoded_envelope_struct(self, command: ProcessPaymentCommand) -> None:
+        """Test that the spliced encoding equals encoding CommandEnvelope itself."""
+        body = _encode_envelope(_envelope_prefix("ProcessPaymentCommand"), command)
+
+        assert body == msgspec.msgpack.encode(CommandEnvelope("ProcessPaymentCommand", command))
+
+    def test_decodes_as_command_envelope(self, command: ProcessPaymentCommand) -> None:
+        """Test that the body decodes into CommandEnvelope."""
+        body = _encode_envelope(_envelope_prefix("ProcessPaymentCommand"), command)
+
+        envelope = msgspec.msgpack.decode(body, type=CommandEnvelope)
+
+        assert envelope.command_type == "ProcessPaymentCommand"
+        assert envelope.payload.command_id == "cmd_123"
+        assert envelope.payload.idempotency_key == "idem_123"
+        assert envelope.payload.timestamp == command.timestamp
+
+    def test_decodes_with_handler_decoder(self, command: ProcessPaymentCommand) -> None:
+        """Test that the handler's decoder and payload struct read the body."""
+        body = _encode_envelope(_envelope_prefix("ProcessPaymentCommand"), command)
+
+        decoded = _msgpack_body_decoder.decode(body)
+        payload = msgspec.convert(decoded["payload"], ProcessPaymentPayload)
+
+        assert decoded["command_type"] == "ProcessPaymentCommand"
+        assert payload == ProcessPaymentPayload(
+            customer_id="cus_123",
+            amount=Decimal("100.50"),
+            currency="USD",
+            payment_method=PaymentMethod.CREDIT_CARD,
+            payment_method_token="tok_123",
+            idempotency_key="idem_123",
+            metadata={"order_id": "ord_123"},
+        )
+
+
+class TestCommandHandlerDecoding:
+    """Test that CommandHandler accepts both wire formats."""
+
+    async def test_handles_msgpack_body(
+        self,
+        handler: CommandHandler,
+        mock_process_payment: Mock,
+        command: ProcessPaymentCommand,
+    ) -> None:
+        """Test that a MessagePack command reaches the use case."""
+        body = _encode_envelope(_envelope_prefix("ProcessPaymentCommand"), command)
+
+        await handler.handle_message(incoming(body, COMMAND_CONTENT_TYPE))
+
+        request = mock_process_payment.execute.await_args.args[0]
+        assert request.amount == Amount(value=Decimal("100.50"), currency="USD")
+        assert request.payment_method == PaymentMethod.CREDIT_CARD
+        assert request.idempotency_key == "idem_123"
+
+    async def test_handles_legacy_json_body(
+        self,
+        handler: CommandHandler,
+        mock_process_payment: Mock,
+        command: ProcessPaymentCommand,
+    ) -> None:
+        """Test that a JSON command queued before the switch is still processed."""
+        body = msgspec.json.encode(CommandEnvelope("ProcessPaymentCommand", command))
+
+        await handler.handle_message(incoming(body, "application/json"))
+
+        request = mock_process_payment.execute.await_args.args[0]
+        assert request.customer_id == "cus_123"
+        assert request.amount == Amount(value=Decimal("100.50"), currency="USD")
+        assert request.metadata == {"order_id": "ord_123"}
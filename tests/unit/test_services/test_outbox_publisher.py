@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import nullcontext
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
@@ -16,14 +18,25 @@ from arch_hexagonal_postgresql_fast.application.services.outbox_publisher import
 )
 
 
+def stream_of(events: list[OutboxEvent]) -> Mock:
+    """Mock iter_unpublished that streams the given events."""
+
+    async def iterate(**_: object) -> AsyncIterator[OutboxEvent]:
+        for event in events:
+            yield event
+
+    return Mock(side_effect=iterate)
+
+
 @pytest.fixture
 def mock_outbox_repo() -> Mock:
     """Create mock outbox repository."""
     repo = Mock()
-    repo.get_unpublished = AsyncMock(return_value=[])
-    repo.mark_published = AsyncMock()
-    repo.increment_attempts = AsyncMock()
-    repo.get_failed = AsyncMock(return_value=[])
+    repo.iter_unpublished = stream_of([])
+    repo.mark_published_many = AsyncMock()
+    repo.increment_attempts_many = AsyncMock()
+    repo.count_failed = AsyncMock(return_value=0)
+    repo.transaction = Mock(side_effect=lambda: nullcontext(repo))
     return repo
 
 
@@ -52,7 +65,7 @@ class TestOutboxPublisherService:
         count = await service.publish_pending_events()
 
         assert count == 0
-        assert mock_outbox_repo.get_unpublished.called
+        mock_outbox_repo.iter_unpublished.assert_called_once_with(limit=100, max_attempts=5)
 
     async def test_publish_pending_events_success(
         self,
@@ -70,8 +83,7 @@ class TestOutboxPublisherService:
             created_at=datetime.now(UTC),
         )
 
-        # First call returns unpublished event, second call returns empty after publish
-        mock_outbox_repo.get_unpublished = AsyncMock(side_effect=[[event], [event], []])
+        mock_outbox_repo.iter_unpublished = stream_of([event])
 
         service = OutboxPublisherService(
             outbox_repo=mock_outbox_repo,
@@ -82,7 +94,8 @@ class TestOutboxPublisherService:
 
         assert count == 1
         assert mock_event_publisher.publish_event.called
-        assert mock_outbox_repo.mark_published.called
+        mock_outbox_repo.mark_published_many.assert_awaited_once_with([event_id])
+        assert mock_outbox_repo.transaction.call_count == 1
 
     async def test_publish_pending_events_with_failure(
         self,
@@ -100,7 +113,7 @@ class TestOutboxPublisherService:
             created_at=datetime.now(UTC),
         )
 
-        mock_outbox_repo.get_unpublished = AsyncMock(return_value=[event])
+        mock_outbox_repo.iter_unpublished = stream_of([event])
         # Make publish_event fail to test failure handling
         mock_event_publisher.publish_event = AsyncMock(side_effect=Exception("RabbitMQ error"))
 
@@ -114,26 +127,56 @@ class TestOutboxPublisherService:
 
         # Event failed to publish, count should be 0
         assert count == 0
-        assert mock_outbox_repo.increment_attempts.called
+        mock_outbox_repo.increment_attempts_many.assert_awaited_once_with(
+            [(event_id, "RabbitMQ error")]
+        )
 
-    async def test_get_failed_events_count(
+    async def test_publish_pending_events_isolates_failures(
         self,
         mock_outbox_repo: Mock,
         mock_event_publisher: Mock,
     ) -> None:
-        """Test getting failed events count."""
-        failed_events = [
+        """Test that one failing event does not stop the rest of the batch."""
+        events = [
             OutboxEvent(
                 id=uuid4(),
                 aggregate_type="Payment",
-                aggregate_id="pay_123",
-                event_type="PaymentFailed",
-                payload={},
+                aggregate_id=f"pay_{i}",
+                event_type="PaymentCompleted",
+                payload={"payment_id": f"pay_{i}"},
                 created_at=datetime.now(UTC),
-                attempts=6,
             )
+            for i in range(3)
         ]
-        mock_outbox_repo.get_failed = AsyncMock(return_value=failed_events)
+        mock_outbox_repo.iter_unpublished = stream_of(events)
+
+        async def publish(*, payload: dict[str, object], **_: object) -> None:
+            if payload["payment_id"] == "pay_1":
+                raise RuntimeError("RabbitMQ error")
+
+        mock_event_publisher.publish_event = AsyncMock(side_effect=publish)
+
+        service = OutboxPublisherService(
+            outbox_repo=mock_outbox_repo,
+            event_publisher=mock_event_publisher,
+        )
+
+        count = await service.publish_pending_events()
+
+        assert count == 2
+        assert mock_outbox_repo.iter_unpublished.call_count == 1
+        mock_outbox_repo.mark_published_many.assert_awaited_once_with([events[0].id, events[2].id])
+        mock_outbox_repo.increment_attempts_many.assert_awaited_once_with(
+            [(events[1].id, "RabbitMQ error")]
+        )
+
+    async def test_get_failed_events_count(
+        self,
+        mock_outbox_repo: Mock,
+        mock_event_publisher: Mock,
+    ) -> None:
+        """Test getting failed events count."""
+        mock_outbox_repo.count_failed = AsyncMock(return_value=1)
 
         service = OutboxPublisherService(
             outbox_repo=mock_outbox_repo,
@@ -143,4 +186,4 @@ class TestOutboxPublisherService:
         count = await service.get_failed_events_count()
 
         assert count == 1
-        assert mock_outbox_repo.get_failed.called
+        mock_outbox_repo.count_failed.assert_awaited_once_with(max_attempts=5)
@@ -0,0 +1,72 @@
+"""Tests for RequestCoalescer."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from arch_hexagonal_postgresql_fast.application.services.request_coalescer import (
+    RequestCoalescer,
+)
+
+
+class TestRequestCoalescer:
+    """Test RequestCoalescer."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        """Test that concurrent callers with the same key run the operation once."""
+        coalescer: RequestCoalescer[str] = RequestCoalescer()
+        release = asyncio.Event()
+        calls = 0
+
+        async def operation() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "done"
+
+        waiters = [asyncio.create_task(coalescer.run("key", operation)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["done", "done", "done"]
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_result_reused_within_ttl(self) -> None:
+        """Test that a retry after completion reuses the cached result."""
+        coalescer: RequestCoalescer[str] = RequestCoalescer(ttl_seconds=60)
+        operation = AsyncMock(return_value="done")
+
+        await coalescer.run("key", operation)
+        result = await coalescer.run("key", operation)
+
+        assert result == "done"
+        operation.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_cached(self) -> None:
+        """Test that a failed operation is retried by the next caller."""
+        coalescer: RequestCoalescer[str] = RequestCoalescer(ttl_seconds=60)
+        operation = AsyncMock(side_effect=[RuntimeError("boom"), "done"])
+
+        with pytest.raises(RuntimeError):
+            await coalescer.run("key", operation)
+        await asyncio.sleep(0)
+
+        assert await coalescer.run("key", operation) == "done"
+        assert operation.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_independently(self) -> None:
+        """Test that distinct keys are not coalesced."""
+        coalescer: RequestCoalescer[str] = RequestCoalescer()
+        operation = AsyncMock(return_value="done")
+
+        await coalescer.run("a", operation)
+        await coalescer.run("b", operation)
+
+        assert operation.await_count == 2
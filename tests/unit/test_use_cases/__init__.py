@@ -56,8 +56,8 @@ def mock_events() -> Mock:
 def mock_idempotency() -> Mock:
     """Create mock idempotency store."""
     store = Mock()
-    store.is_duplicate = AsyncMock(return_value=False)
-    store.store_result = AsyncMock()
+    store.get_result = AsyncMock(return_value=None)
+    store.claim = AsyncMock(return_value=True)
     return store
 
 
@@ -108,7 +108,6 @@ class TestProcessPayment:
     ) -> None:
         """Test payment processing with idempotency check."""
         # Setup duplicate
-        mock_idempotency.is_duplicate = AsyncMock(return_value=True)
         mock_idempotency.get_result = AsyncMock(
             return_value={
                 "payment_id": "pay_123",
@@ -22,6 +22,7 @@ def mock_payment_repo() -> Mock:
     """Create mock payment repository."""
     repo = Mock()
     repo.save = AsyncMock()
+    repo.save_with_outbox = AsyncMock()
     return repo
 
 
@@ -56,8 +57,8 @@ def mock_events() -> Mock:
 def mock_idempotency() -> Mock:
     """Create mock idempotency store."""
     store = Mock()
-    store.is_duplicate = AsyncMock(return_value=False)
-    store.store_result = AsyncMock()
+    store.get_result = AsyncMock(return_value=None)
+    store.claim = AsyncMock(return_value=True)
     return store
 
 
@@ -105,9 +106,10 @@ class TestProcessPayment:
         assert result.status == "completed"
         assert result.provider_transaction_id == "tx_123"
         assert mock_provider.charge.called
-        assert mock_payment_repo.save.call_count >= 1
-        # Events now saved to outbox instead of direct publishing
-        assert mock_outbox_repo.save.call_count >= 2  # Created + Completed
+        # Payment, transaction and event are written together: Created + Completed
+        calls = mock_payment_repo.save_with_outbox.await_args_list
+        assert [c.args[1].event_type for c in calls] == ["PaymentCreated", "PaymentCompleted"]
+        assert calls[1].args[2].provider_transaction_id == "tx_123"
 
     async def test_process_payment_with_idempotency(
         self,
@@ -120,7 +122,6 @@ class TestProcessPayment:
     ) -> None:
         """Test payment processing with idempotency check."""
         # Setup duplicate
-        mock_idempotency.is_duplicate = AsyncMock(return_value=True)
         mock_idempotency.get_result = AsyncMock(
             return_value={
                 "payment_id": "pay_123",
@@ -185,5 +186,7 @@ class TestProcessPayment:
         with pytest.raises(Exception, match="Payment failed"):
             await use_case.execute(request)
 
-        # Failure event saved to outbox instead of direct publishing
-        assert mock_outbox_repo.save.call_count >= 2  # Created + Failed
+        # Failure is written with its transaction and event: Created + Failed
+        calls = mock_payment_repo.save_with_outbox.await_args_list
+        assert [c.args[1].event_type for c in calls] == ["PaymentCreated", "PaymentFailed"]
+        assert calls[1].args[2].error_message == "Payment failed"
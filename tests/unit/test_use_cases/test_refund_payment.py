@@ -26,7 +26,7 @@ from arch_hexagonal_postgresql_fast.domain.value_objects.transaction_status impo
 def mock_payment_repo() -> Mock:
     """Create mock payment repository."""
     repo = Mock()
-    repo.save = AsyncMock()
+    repo.save_with_outbox = AsyncMock()
     repo.get_by_id = AsyncMock()
     return repo
 
@@ -60,9 +60,8 @@ def mock_events() -> Mock:
 def mock_idempotency() -> Mock:
     """Create mock idempotency store."""
     store = Mock()
-    store.is_duplicate = AsyncMock(return_value=False)
     store.get_result = AsyncMock(return_value=None)
-    store.store_result = AsyncMock()
+    store.claim = AsyncMock(return_value=True)
     return store
 
 
@@ -126,10 +125,10 @@ class TestRefundPayment:
         assert result.status == "refunded"
         assert result.refund_transaction_id == "refund_tx_123"
         assert mock_provider.refund.called
-        assert mock_payment_repo.save.called
-        assert mock_transaction_repo.save.called
-        # Event saved to outbox instead of direct publishing
-        assert mock_outbox_repo.save.called
+        # Payment, transaction and event saved in one write, not published directly
+        mock_payment_repo.save_with_outbox.assert_awaited_once()
+        _, _, transaction = mock_payment_repo.save_with_outbox.await_args.args
+        assert transaction.transaction_type == "refund"
 
     async def test_partial_refund_success(
         self,
@@ -200,7 +199,7 @@ class TestRefundPayment:
             await use_case.execute(request)
 
         assert not mock_provider.refund.called
-        assert not mock_outbox_repo.save.called
+        assert not mock_payment_repo.save_with_outbox.called
 
     async def test_cannot_refund_pending_payment(
         self,
@@ -292,7 +291,6 @@ class TestRefundPayment:
         mock_outbox_repo: Mock,
     ) -> None:
         """Test refund returns cached result on duplicate request."""
-        mock_idempotency.is_duplicate = AsyncMock(return_value=True)
         mock_idempotency.get_result = AsyncMock(
             return_value={
                 "payment_id": "pay_123",
@@ -395,15 +393,15 @@ class TestRefundPayment:
 
         await use_case.execute(request)
 
-        # Verify outbox save was called
-        assert mock_outbox_repo.save.called
-        saved_event = mock_outbox_repo.save.call_args[0][0]
+        # Verify the event was saved with the payment
+        mock_payment_repo.save_with_outbox.assert_awaited_once()
+        saved_event = mock_payment_repo.save_with_outbox.await_args.args[1]
 
         assert saved_event.aggregate_type == "Payment"
         assert saved_event.aggregate_id == "pay_123"
         assert saved_event.event_type == "PaymentRefunded"
         assert saved_event.payload["payment_id"] == "pay_123"
         assert saved_event.payload["customer_id"] == "cus_123"
-        assert saved_event.payload["refund_amount"] == "100.00 USD"
+        assert saved_event.payload["refund_amount_cents"] == 10000
         assert saved_event.payload["currency"] == "USD"
         assert saved_event.payload["refund_transaction_id"] == "refund_tx_123"